@@ -6,7 +6,7 @@ import os
 import importlib.util
 import inspect
 import json
-import random
+import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, TypedDict, List, Dict, Any, Optional
@@ -50,6 +50,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from chaos_engine import get_chaos_engine
 from .langgraph_rag import create_domain_rag_tool
 
+logger = logging.getLogger(__name__)
+
 
 # Define the state for our graph
 class State(TypedDict):
@@ -146,10 +148,12 @@ def _extract_tool_steer_instructions(messages: List[BaseMessage]) -> Optional[st
         if payload and payload.get("steered_by_agent_control"):
             instruction = payload.get("steering_instructions") or payload.get("error", "")
             if instruction:
-                instructions.insert(0, str(instruction))
+                instructions.append(str(instruction))
         idx -= 1
     if not instructions:
         return None
+    # Collected newest-first; restore chronological order in one pass.
+    instructions.reverse()
     return "\n".join(instructions)
 
 
@@ -239,8 +243,15 @@ class LangGraphAgent(BaseAgent):
         with open(tool_schema_path, "r") as f:
             tool_schema = json.load(f)
 
+        # Index schemas by tool name once instead of scanning the list per tool.
+        schemas_by_name: Dict[str, dict] = {}
+        for schema in tool_schema:
+            name = schema.get("name")
+            if name:
+                schemas_by_name.setdefault(name, schema)
+
         llm_step_name = f"{self.domain_config.name.title()} Assistant"
-        tool_names = [schema.get("name") for schema in tool_schema if schema.get("name")]
+        tool_names = list(schemas_by_name)
         control_steps = build_agent_control_steps(llm_step_name, tool_names)
         
         # Create a module specification from the file path
@@ -277,10 +288,7 @@ class LangGraphAgent(BaseAgent):
                 print(f"   🛡️ Agent Control step '{step_name}' → {func_name}")
 
             # For domain tools, find schema; for RAG tool, use function metadata
-            tool_schema_dict = next(
-                (schema for schema in tool_schema if schema.get("name") == tool_func.__name__), 
-                None
-            )
+            tool_schema_dict = schemas_by_name.get(tool_func.__name__)
             
             tool_kwargs = {
                 "name": tool_func.__name__,
@@ -404,7 +412,7 @@ class LangGraphAgent(BaseAgent):
 
             # 🔥 CHAOS: Corrupt tool messages before LLM sees them (runtime check!)
             chaos = get_chaos_engine()
-            if chaos.sloppiness_enabled and random.random() < chaos.sloppiness_rate:
+            if chaos.should_apply_sloppiness():
                 for i, msg in enumerate(messages):
                     if isinstance(msg, ToolMessage):
                         corrupted_content = chaos.transpose_numbers(msg.content)
@@ -470,7 +478,11 @@ class LangGraphAgent(BaseAgent):
 
         return graph_builder.compile()
     
-    async def _process_query_async(self, messages: List[Dict[str, str]]) -> str:
+    async def _process_query_async(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """Process a user query asynchronously (required for @control async nodes)."""
         provider_token = set_llm_provider(self.llm_provider)
         response = "No response generated"
@@ -495,7 +507,7 @@ class LangGraphAgent(BaseAgent):
                 trace_name="Run Agent",
             )
 
-            result = await self.graph.ainvoke(initial_state, self.config)
+            result = await self.graph.ainvoke(initial_state, config or self.config)
             if result["messages"]:
                 response = result["messages"][-1].content
             return response
@@ -504,16 +516,18 @@ class LangGraphAgent(BaseAgent):
             if self.galileo_logger:
                 finalize_trace(self.galileo_logger, response)
 
-    def process_query(self, messages: List[Dict[str, str]]) -> str:
-        """Process a user query and return a response"""
+    def process_query(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Process a user query and return a response (config overrides self.config for this call)"""
         try:
-            return _run_async(self._process_query_async(messages))
+            return _run_async(self._process_query_async(messages, config))
         except ControlViolationError as e:
             return format_blocked_message(e, step_name="Bank Assistant")
         except ControlSteerError as e:
             return format_blocked_message(e, step_name="Bank Assistant", steered=True)
         except Exception as e:
-            print(f"[ERROR] Error processing query: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error processing query")
             return f"Error processing your request: {str(e)}"
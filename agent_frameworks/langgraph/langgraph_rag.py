@@ -4,7 +4,9 @@ Handles RAG retrieval logic for LangGraph agents using LangChain's retrieval cha
 Uses PostgreSQL with pgvector for vector storage.
 """
 import asyncio
+import logging
 import os
+import threading
 from typing import Optional
 
 from langsmith import Client as LangSmithClient
@@ -23,9 +25,15 @@ from domain_manager import DomainManager
 from helpers.agent_control_helpers import domain_controlled_tool
 from setup_env import setup_environment
 
+logger = logging.getLogger(__name__)
+
 
 # Global cache for RAG instances
 _rag_cache = {}
+# Per-key creation locks: concurrent sessions asking for the same RAG system wait
+# for the one in-flight build, while different domains/models build in parallel.
+_rag_init_locks = {}
+_rag_init_locks_guard = threading.Lock()
 
 
 class DomainRAGSystem:
@@ -108,11 +116,8 @@ class DomainRAGSystem:
                 f"✅ RAG system initialized for domain '{self.domain_name}' (model: {llm_model})"
             )
 
-        except Exception as e:
-            print(f"❌ Error initializing RAG system for domain '{self.domain_name}': {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error initializing RAG system for domain '%s'", self.domain_name)
             self._initialized = False
 
     async def search(self, query: str) -> str:
@@ -123,6 +128,10 @@ class DomainRAGSystem:
                 "Please check your vector database setup."
             )
 
+        # Nothing to retrieve for a blank query; skip the embedding call and LLM round-trip
+        if not query or not query.strip():
+            return "No query provided. Please ask a question to search the knowledge base."
+
         try:
             # PGVector is created in sync mode; use invoke (not ainvoke) in a thread
             # so we don't block the event loop or require async_mode on the store.
@@ -150,9 +159,16 @@ def get_domain_rag_system(
             top_k = 5
 
     cache_key = f"{domain_name}_{top_k}_{model_name or 'default'}_{get_llm_provider()}"
-    if cache_key not in _rag_cache:
-        _rag_cache[cache_key] = DomainRAGSystem(domain_name, top_k, model_name=model_name)
-    return _rag_cache[cache_key]
+    rag_system = _rag_cache.get(cache_key)
+    if rag_system is None:
+        with _rag_init_locks_guard:
+            init_lock = _rag_init_locks.setdefault(cache_key, threading.Lock())
+        with init_lock:
+            rag_system = _rag_cache.get(cache_key)
+            if rag_system is None:
+                rag_system = DomainRAGSystem(domain_name, top_k, model_name=model_name)
+                _rag_cache[cache_key] = rag_system
+    return rag_system
 
 
 def create_domain_rag_tool(
@@ -6,10 +6,11 @@ from typing import Optional
 import streamlit as st
 import os
 import io
+import threading
 
 # Load environment from secrets before importing domain/agent modules.
 from dotenv import load_dotenv
-from setup_env import setup_environment
+from setup_env import get_domain_project_name, setup_environment
 
 # Load environment variables
 load_dotenv()
@@ -29,6 +30,7 @@ from helpers.galileo_api_helpers import (
     get_galileo_app_url,
     get_galileo_project_id,
     get_galileo_log_stream_id,
+    prefetch_galileo_ids,
 )
 from helpers.agent_control_helpers import init_agent_control
 from helpers.hallucination_helpers import log_hallucination_for_domain
@@ -966,6 +968,8 @@ def multi_domain_agent_app(domain_name: str):
                             domain_name=domain_name,
                             domain_config=domain_full_config,
                             existing_logger=existing_logger,
+                            # Wait for the upload so a failed flush reaches the error below
+                            sync=True,
                         )
                         if success:
                             add_hallucination_interaction_to_chat(domain_full_config)
@@ -1091,6 +1095,23 @@ def main():
             st.info("Example: Create 'domains/finance/config.yaml' with your domain configuration.")
             st.stop()
         
+        # Warm the Galileo project/log stream ID caches for every domain in the
+        # background so switching domains doesn't wait on sequential lookups
+        if "galileo_ids_prefetched" not in st.session_state:
+            st.session_state.galileo_ids_prefetched = True
+            targets = []
+            for domain in available_domains:
+                try:
+                    domain_config = dm.load_domain_config(domain).config
+                except Exception:
+                    continue
+                galileo_config = domain_config.get("galileo", {})
+                targets.append((
+                    get_domain_project_name(domain, domain_config),
+                    galileo_config.get("log_stream", "default"),
+                ))
+            threading.Thread(target=prefetch_galileo_ids, args=(targets,), daemon=True).start()
+
         # Create pages dictionary for st.navigation
         pages = []
         
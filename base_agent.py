@@ -27,12 +27,17 @@ class BaseAgent(ABC):
         pass
     
     @abstractmethod
-    def process_query(self, messages: List[Dict[str, str]]) -> str:
+    def process_query(
+        self,
+        messages: List[Dict[str, str]],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         Process a user query and return a response.
         
         Args:
             messages: List of conversation messages in format [{"role": "user", "content": "..."}]
+            config: Optional per-call run config (e.g. callbacks); defaults to the agent's own
             
         Returns:
             String response from the agent
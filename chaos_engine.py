@@ -14,9 +14,49 @@ The actual APPLICATION of chaos is handled by chaos_wrapper.py.
 import random
 import re
 import logging
+import threading
+from collections import Counter
 from typing import Optional, Any, Tuple
 
 
+# Numbers with optional thousands separators and decimals (e.g. "178", "1,234.56")
+_NUMBER_RE = re.compile(r'\d+(?:,\d+)*(?:\.\d+)?')
+
+# Realistic HTTP errors with status codes ({tool_name} is filled in per failure)
+_API_ERROR_TEMPLATES = (
+    # Server errors (5xx) - most common in production
+    "{tool_name} temporarily unavailable (503 Service Unavailable)",
+    "{tool_name} internal error (500 Internal Server Error)",
+    "{tool_name} bad gateway (502 Bad Gateway)",
+    "{tool_name} gateway timeout (504 Gateway Timeout)",
+
+    # Client errors (4xx)
+    "{tool_name} authentication failed (401 Unauthorized)",
+    "{tool_name} access forbidden (403 Forbidden)",
+    "{tool_name} resource not found (404 Not Found)",
+
+    # Network/connection errors
+    "{tool_name} timeout after 30 seconds (Connection Timeout)",
+    "Connection refused: {tool_name} server not responding",
+    "Network error: Failed to reach {tool_name} endpoint",
+    "SSL certificate validation failed for {tool_name}",
+)
+
+_RAG_ERRORS = (
+    # Generic vector DB errors
+    "Vector database connection timeout",
+    "Vector database service unavailable",
+    "Embedding model failed to respond",
+    "RAG retrieval returned empty results",
+    "Document index corrupted",
+
+    # Specific vector DB errors
+    "ChromaDB service unavailable",
+    "PostgreSQL connection unavailable",
+    "Embedding dimension mismatch error",
+)
+
+
 class ChaosEngine:
     """
     Chaos engineering engine for simulating real-world failures.
@@ -25,7 +65,11 @@ class ChaosEngine:
     It's domain-agnostic and works with any tools from any domain.
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Per-engine RNG: avoids sharing the module-level random state across
+        # sessions and lets demos/tests replay a run by passing a seed.
+        self._rng = random.Random(seed)
+
         # Chaos toggles (controlled from UI)
         self.tool_instability_enabled = False
         self.sloppiness_enabled = False
@@ -40,12 +84,35 @@ class ChaosEngine:
         self.rate_limit_rate = 1.0  # 100% - always fails when enabled
         self.data_corruption_rate = 1.0  # 100% - always corrupts when enabled
         
-        # Counters for statistics
-        self.tool_instability_count = 0
-        self.sloppiness_count = 0
-        self.rag_chaos_count = 0
-        self.rate_limit_chaos_count = 0
-        self.data_corruption_count = 0
+        # Counters for statistics (tools may run on worker threads, so updates are locked)
+        self._stats = Counter()
+        self._stats_lock = threading.Lock()
+    
+    def _record(self, counter: str):
+        """Increment one chaos statistics counter."""
+        with self._stats_lock:
+            self._stats[counter] += 1
+    
+    # Read-only views of the counters, kept for existing callers
+    @property
+    def tool_instability_count(self) -> int:
+        return self._stats["tool_instability_count"]
+
+    @property
+    def sloppiness_count(self) -> int:
+        return self._stats["sloppiness_count"]
+
+    @property
+    def rag_chaos_count(self) -> int:
+        return self._stats["rag_chaos_count"]
+
+    @property
+    def rate_limit_chaos_count(self) -> int:
+        return self._stats["rate_limit_chaos_count"]
+
+    @property
+    def data_corruption_count(self) -> int:
+        return self._stats["data_corruption_count"]
     
     def enable_tool_instability(self, enabled: bool = True, failure_rate: Optional[float] = None):
         """Enable random API failures"""
@@ -102,29 +169,11 @@ class ChaosEngine:
         if not self.tool_instability_enabled:
             return False, None
         
-        self.tool_instability_count += 1
+        self._record("tool_instability_count")
         
-        if random.random() < self.tool_failure_rate:
-            # Realistic HTTP errors with status codes
-            errors = [
-                # Server errors (5xx) - most common in production
-                f"{tool_name} temporarily unavailable (503 Service Unavailable)",
-                f"{tool_name} internal error (500 Internal Server Error)",
-                f"{tool_name} bad gateway (502 Bad Gateway)",
-                f"{tool_name} gateway timeout (504 Gateway Timeout)",
-                
-                # Client errors (4xx)
-                f"{tool_name} authentication failed (401 Unauthorized)",
-                f"{tool_name} access forbidden (403 Forbidden)",
-                f"{tool_name} resource not found (404 Not Found)",
-                
-                # Network/connection errors
-                f"{tool_name} timeout after 30 seconds (Connection Timeout)",
-                f"Connection refused: {tool_name} server not responding",
-                f"Network error: Failed to reach {tool_name} endpoint",
-                f"SSL certificate validation failed for {tool_name}",
-            ]
-            error = random.choice(errors)
+        if self._rng.random() < self.tool_failure_rate:
+            # Only the chosen template is formatted
+            error = self._rng.choice(_API_ERROR_TEMPLATES).format(tool_name=tool_name)
             logging.warning(f"🔥 CHAOS: Injecting API failure for {tool_name}: {error}")
             return True, error
         
@@ -143,14 +192,28 @@ class ChaosEngine:
         if not self.rate_limit_chaos_enabled:
             return False, None
         
-        if random.random() < self.rate_limit_rate:
-            self.rate_limit_chaos_count += 1
+        if self._rng.random() < self.rate_limit_rate:
+            self._record("rate_limit_chaos_count")
             error = f"Rate limit exceeded for {tool_name}. Please try again later. (429 Too Many Requests)"
             logging.warning(f"🔥 CHAOS: Injecting rate limit error: {error}")
             return True, error
         
         return False, None
     
+    def should_apply_sloppiness(self) -> bool:
+        """
+        Roll whether this turn's tool results get their numbers transposed.
+        
+        Uses the engine's RNG so seeded chaos runs are reproducible.
+        
+        Returns:
+            True if transpose_numbers should be applied this turn
+        """
+        if not self.sloppiness_enabled:
+            return False
+        
+        return self._rng.random() < self.sloppiness_rate
+    
     def transpose_numbers(self, text: str) -> str:
         """
         Replace numbers with obviously wrong random numbers to simulate hallucinations.
@@ -171,10 +234,6 @@ class ChaosEngine:
         if not self.sloppiness_enabled:
             return text
         
-        # Find all numbers with decimals (e.g., "178.45") and integers (e.g., "178")
-        # Match numbers with optional decimals and commas
-        number_pattern = r'\d+(?:,\d+)*(?:\.\d+)?'
-        
         def replace_number(match):
             """Replace a number with a random wrong number of similar magnitude"""
             original = match.group(0)
@@ -188,7 +247,7 @@ class ChaosEngine:
                     # Float number
                     val = float(clean_num)
                     # Generate random number in similar range (0.5x to 3x)
-                    new_val = val * random.uniform(0.5, 3.0)
+                    new_val = val * self._rng.uniform(0.5, 3.0)
                     # Keep same decimal places
                     decimal_places = len(clean_num.split('.')[1])
                     corrupted = f"{new_val:.{decimal_places}f}"
@@ -198,10 +257,10 @@ class ChaosEngine:
                     # Generate random number in similar range
                     if val < 10:
                         # Small numbers: just scramble or change
-                        corrupted = str(random.randint(0, 20))
+                        corrupted = str(self._rng.randint(0, 20))
                     else:
                         # Larger numbers: multiply by 0.5x to 3x
-                        new_val = int(val * random.uniform(0.5, 3.0))
+                        new_val = int(val * self._rng.uniform(0.5, 3.0))
                         corrupted = str(new_val)
                         
                         # Add commas back if original had them
@@ -215,11 +274,11 @@ class ChaosEngine:
                 # If parsing fails, return original
                 return original
         
-        # Replace all numbers in the text
-        result = re.sub(number_pattern, replace_number, text)
+        # Replace all numbers in the text (decimals like "178.45" and integers like "178")
+        result = _NUMBER_RE.sub(replace_number, text)
         
         if result != text:
-            self.sloppiness_count += 1
+            self._record("sloppiness_count")
         
         return result
     
@@ -233,22 +292,9 @@ class ChaosEngine:
         if not self.rag_chaos_enabled:
             return False, None
         
-        if random.random() < self.rag_failure_rate:
-            errors = [
-                # Generic vector DB errors
-                "Vector database connection timeout",
-                "Vector database service unavailable",
-                "Embedding model failed to respond",
-                "RAG retrieval returned empty results",
-                "Document index corrupted",
-                
-                # Specific vector DB errors
-                "ChromaDB service unavailable",
-                "PostgreSQL connection unavailable",
-                "Embedding dimension mismatch error",
-            ]
-            error = random.choice(errors)
-            self.rag_chaos_count += 1
+        if self._rng.random() < self.rag_failure_rate:
+            error = self._rng.choice(_RAG_ERRORS)
+            self._record("rag_chaos_count")
             logging.warning(f"🔥 CHAOS: Injecting RAG failure: {error}")
             return True, error
         
@@ -263,8 +309,8 @@ class ChaosEngine:
         """
         if self.tool_instability_enabled:
             # Occasionally inject significant latency
-            if random.random() < 0.1:  # 10% chance
-                delay = random.uniform(2.0, 5.0)
+            if self._rng.random() < 0.1:  # 10% chance
+                delay = self._rng.uniform(2.0, 5.0)
                 logging.warning(f"🔥 CHAOS: Injecting {delay:.1f}s latency")
                 return delay
         
@@ -280,8 +326,8 @@ class ChaosEngine:
         if not self.data_corruption_enabled:
             return False
         
-        if random.random() < self.data_corruption_rate:
-            self.data_corruption_count += 1
+        if self._rng.random() < self.data_corruption_rate:
+            self._record("data_corruption_count")
             logging.warning(f"🔥 CHAOS: Injecting data corruption via LLM prompt")
             return True
         
@@ -318,12 +364,14 @@ numbers or indicate uncertainty. This validates monitoring system detection capa
     
     def get_stats(self) -> dict:
         """Get chaos statistics"""
+        with self._stats_lock:
+            counts = dict(self._stats)
         return {
-            "tool_instability_count": self.tool_instability_count,
-            "sloppiness_count": self.sloppiness_count,
-            "rag_chaos_count": self.rag_chaos_count,
-            "rate_limit_chaos_count": self.rate_limit_chaos_count,
-            "data_corruption_count": self.data_corruption_count,
+            "tool_instability_count": counts.get("tool_instability_count", 0),
+            "sloppiness_count": counts.get("sloppiness_count", 0),
+            "rag_chaos_count": counts.get("rag_chaos_count", 0),
+            "rate_limit_chaos_count": counts.get("rate_limit_chaos_count", 0),
+            "data_corruption_count": counts.get("data_corruption_count", 0),
             "tool_instability_enabled": self.tool_instability_enabled,
             "sloppiness_enabled": self.sloppiness_enabled,
             "rag_chaos_enabled": self.rag_chaos_enabled,
@@ -333,11 +381,8 @@ numbers or indicate uncertainty. This validates monitoring system detection capa
     
     def reset_stats(self):
         """Reset counters"""
-        self.tool_instability_count = 0
-        self.sloppiness_count = 0
-        self.rag_chaos_count = 0
-        self.rate_limit_chaos_count = 0
-        self.data_corruption_count = 0
+        with self._stats_lock:
+            self._stats.clear()
 
 
 # Fallback global instance for non-Streamlit contexts (tests, scripts)
@@ -13,6 +13,7 @@ Usage:
     # Tools now have chaos automatically!
 """
 import json
+import re
 import time
 import functools
 import inspect
@@ -26,9 +27,7 @@ class APIError(Exception):
         super().__init__(message)
         self.status_code = status_code
         self.error_type = error_type
-        self.metadata = kwargs
-        self.metadata['status_code'] = status_code
-        self.metadata['error_type'] = error_type
+        self.metadata = {**kwargs, 'status_code': status_code, 'error_type': error_type}
     
     def __str__(self):
         # Format: [STATUS_CODE] message | metadata as key=value
@@ -36,16 +35,21 @@ class APIError(Exception):
         return f"[{self.status_code}] {super().__str__()} | {metadata_str}"
 
 
+# Compiled once: status codes first, then the network/SSL keyword fallbacks
+_STATUS_CODE_RE = re.compile(r"503|502|504|500|401|403|404|405|429")
+_TIMEOUT_RE = re.compile(r"timeout|connection", re.IGNORECASE)
+_SSL_RE = re.compile(r"ssl|certificate", re.IGNORECASE)
+
+
 def _extract_status_code(error_msg: str) -> str:
     """Extract HTTP status code from error message."""
-    status_codes = ["503", "502", "504", "500", "401", "403", "404", "405", "429"]
-    for code in status_codes:
-        if code in error_msg:
-            return code
+    match = _STATUS_CODE_RE.search(error_msg)
+    if match:
+        return match.group(0)
     
-    if "timeout" in error_msg.lower() or "connection" in error_msg.lower():
+    if _TIMEOUT_RE.search(error_msg):
         return "timeout"
-    elif "ssl" in error_msg.lower() or "certificate" in error_msg.lower():
+    elif _SSL_RE.search(error_msg):
         return "ssl_error"
     
     return "500"
@@ -2,15 +2,16 @@
 Domain Manager - Discovers and loads domain configurations
 """
 import os
+import threading
 import yaml
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainConfig:
-    """Container for domain configuration data"""
+    """Container for domain configuration data (shared via the config cache, so frozen)"""
     name: str
     description: str
     config: Dict
@@ -20,6 +21,21 @@ class DomainConfig:
     dataset_file: str
 
 
+# Files every domain directory must contain (read-only; shared by all checks)
+REQUIRED_DOMAIN_FILES = (
+    "config.yaml",
+    "system_prompt.json",
+    "tools/schema.json",
+    "tools/logic.py",
+)
+
+# Parsed domain configs shared by every DomainManager instance, keyed by the
+# absolute domain path and invalidated by config.yaml/system_prompt.json mtimes.
+# Cached DomainConfig objects are shared between callers and must not be mutated.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], DomainConfig]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 class DomainManager:
     """Manages domain discovery and configuration loading"""
     
@@ -43,14 +59,7 @@ class DomainManager:
     
     def _is_valid_domain(self, domain_path: str) -> bool:
         """Check if a directory contains a valid domain structure"""
-        required_files = [
-            "config.yaml",
-            "system_prompt.json",
-            "tools/schema.json",
-            "tools/logic.py"
-        ]
-        
-        for file_path in required_files:
+        for file_path in REQUIRED_DOMAIN_FILES:
             full_path = os.path.join(domain_path, file_path)
             if not os.path.exists(full_path):
                 return False
@@ -67,12 +76,21 @@ class DomainManager:
         if not self._is_valid_domain(domain_path):
             raise ValueError(f"Domain '{domain_name}' has invalid structure")
         
-        # Load config.yaml
         config_path = os.path.join(domain_path, "config.yaml")
+        system_prompt_path = os.path.join(domain_path, "system_prompt.json")
+
+        # Reuse the parsed config until either source file changes on disk
+        cache_key = os.path.abspath(domain_path)
+        mtimes = (os.stat(config_path).st_mtime_ns, os.stat(system_prompt_path).st_mtime_ns)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+
+        # Load config.yaml
         config = self._load_yaml(config_path)
         
         # Load system_prompt.json
-        system_prompt_path = os.path.join(domain_path, "system_prompt.json")
         system_prompt = self._load_json(system_prompt_path)
         
         # Get directory paths
@@ -80,7 +98,7 @@ class DomainManager:
         docs_dir = os.path.join(domain_path, "docs")
         dataset_file = os.path.join(domain_path, "dataset.csv")
         
-        return DomainConfig(
+        domain_config = DomainConfig(
             name=domain_name,
             description=config.get("domain", {}).get("description", ""),
             config=config,
@@ -89,6 +107,9 @@ class DomainManager:
             docs_dir=docs_dir,
             dataset_file=dataset_file
         )
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[cache_key] = (mtimes, domain_config)
+        return domain_config
     
     def get_domain_info(self, domain_name: str) -> Dict:
         """Get domain metadata for UI display"""
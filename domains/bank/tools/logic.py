@@ -41,12 +41,14 @@ _vector_store: Optional[PGVector] = None
 _embedding_model: Optional[str] = None
 _collection_name_cached: Optional[str] = None
 
+logger = logging.getLogger(__name__)
+
 galileo_logger_key = "galileo_logger_bank"
 if st.session_state.get(galileo_logger_key):
-    print(f"[log.py] --> Galileo logger found! {st.session_state[galileo_logger_key]}", flush=True)
     galileo_logger = st.session_state[galileo_logger_key]
+    logger.debug("Galileo logger found: %s", galileo_logger)
 else:
-    print("[log.py] --> Galileo logger not found!", flush=True)
+    logger.debug("Galileo logger not found")
     galileo_logger = None
 
 
@@ -94,7 +96,7 @@ def _log_tool_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
@@ -104,7 +106,7 @@ def _log_tool_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["bank"],
     )
@@ -114,25 +116,25 @@ def _log_retriever_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
     global galileo_logger
 
     if not galileo_logger:
-        print("[_log_retriever_span] --> No Galileo logger found", flush=True)
+        logger.debug("No Galileo logger; skipping retriever span %s", name)
         return
 
     galileo_logger.add_retriever_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["bank"],
     )
-    print(f"[_log_retriever_span] --> Galileo logger found! {galileo_logger.trace_id}_", flush=True)
+    logger.debug("Logged retriever span %s on trace %s", name, galileo_logger.trace_id)
 
 
 def _resolve_galileo_logger(*_args, **_kwargs) -> Optional[GalileoLogger]:
@@ -171,7 +173,7 @@ async def get_customer_info(customer_id: str) -> str:
 
     Returns customer name, address, phone number, account type, and balance.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     customer_id = customer_id.strip().upper()
 
     q = (customer_id or "").strip()
@@ -213,7 +215,7 @@ async def get_customer_info(customer_id: str) -> str:
         "get_customer_info",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["bank", "tool"],
     )
@@ -224,7 +226,7 @@ async def delete_customer_record(customer_id: str) -> str:
     """
     Permanently delete a customer record from the registry by customer ID.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     customer_id = customer_id.strip().upper()
 
     q = (customer_id or "").strip()
@@ -266,7 +268,7 @@ async def delete_customer_record(customer_id: str) -> str:
         "delete_customer_record",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["bank", "tool", "delete"],
     )
@@ -280,7 +282,7 @@ async def search_bank_qa(query: str) -> str:
 
     Returns relevant Q&A content about credit cards, payments and statements.
     """
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     q = query
     try:
         vs, collection_name = _get_vector_store()
@@ -290,7 +292,7 @@ async def search_bank_qa(query: str) -> str:
             "Retrieve Online Bank Information",
             {"query": q},
             err,
-            start,
+            start_ns,
             tags=["bank", "error"],
         )
         return json.dumps(err)
@@ -300,7 +302,7 @@ async def search_bank_qa(query: str) -> str:
         rag_system = get_domain_rag_system("bank", 1)
         raw = await rag_system.search(search_q)
     except Exception as e:
-        logging.exception("search_bank_qa search failed")
+        logger.exception("search_bank_qa search failed")
         err = {"error": str(e), "query": search_q}
         return json.dumps(err)
 
@@ -310,7 +312,7 @@ async def search_bank_qa(query: str) -> str:
         "Retrieve Online Bank Information",
         {"query": q},
         snippets,
-        start,
+        start_ns,
         metadata={"count": len(snippets), "collection": collection_name},
         tags=["bank", "retrieval"],
     )
@@ -41,12 +41,14 @@ _vector_store: Optional[PGVector] = None
 _embedding_model: Optional[str] = None
 _collection_name_cached: Optional[str] = None
 
+logger = logging.getLogger(__name__)
+
 galileo_logger_key = "galileo_logger_healthcare"
 if st.session_state.get(galileo_logger_key):
-    print(f"[log.py] --> Galileo logger found! {st.session_state[galileo_logger_key]}", flush=True)
     galileo_logger = st.session_state[galileo_logger_key]
+    logger.debug("Galileo logger found: %s", galileo_logger)
 else:
-    print("[log.py] --> Galileo logger not found!", flush=True)
+    logger.debug("Galileo logger not found")
     galileo_logger = None
 
 
@@ -94,7 +96,7 @@ def _log_tool_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
@@ -104,7 +106,7 @@ def _log_tool_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["healthcare"],
     )
@@ -114,25 +116,25 @@ def _log_retriever_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
     global galileo_logger
 
     if not galileo_logger:
-        print("[_log_retriever_span] --> No Galileo logger found", flush=True)
+        logger.debug("No Galileo logger; skipping retriever span %s", name)
         return
 
     galileo_logger.add_retriever_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["healthcare"],
     )
-    print(f"[_log_retriever_span] --> Galileo logger found! {galileo_logger.trace_id}_", flush=True)
+    logger.debug("Logged retriever span %s on trace %s", name, galileo_logger.trace_id)
 
 
 def _resolve_galileo_logger(*_args, **_kwargs) -> Optional[GalileoLogger]:
@@ -150,7 +152,7 @@ async def _execute_patient_sql(sql: str) -> str:
     """Execute a SQL lookup against the patient registry."""
     try:
         result = execute_sql(sql)
-        return json.dumps(result)
+        return json.dumps(result, default=str)
     except Exception as e:
         return json.dumps({"error": str(e), "sql": sql})
 
@@ -171,7 +173,7 @@ async def get_patient_info(patient_id: str) -> str:
 
     Returns patient name, address, phone number, patient type, and prescription.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     patient_id = patient_id.strip().upper()
 
     q = (patient_id or "").strip()
@@ -193,7 +195,7 @@ async def get_patient_info(patient_id: str) -> str:
             model=model,
             use_case_identifier="patient_id",
             use_case_value=patient_id
-        ) 
+        )
     except Exception as e:
         err = {"error": str(e), "patient_id": q}
         return json.dumps(err)
@@ -213,18 +215,18 @@ async def get_patient_info(patient_id: str) -> str:
         "get_patient_info",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["healthcare", "tool"],
     )
-    return json.dumps(result)
+    return json.dumps(result, default=str)
 
 
 async def delete_patient_record(patient_id: str) -> str:
     """
     Permanently delete a patient record from the registry by patient ID.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     patient_id = patient_id.strip().upper()
 
     q = (patient_id or "").strip()
@@ -245,7 +247,7 @@ async def delete_patient_record(patient_id: str) -> str:
             operation="delete",
             model=model,
             use_case_identifier="patient_id",
-            use_case_value=patient_id
+            use_case_value=patient_id            
         )
     except Exception as e:
         err = {"error": str(e), "patient_id": q}
@@ -266,7 +268,7 @@ async def delete_patient_record(patient_id: str) -> str:
         "delete_patient_record",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["healthcare", "tool", "delete"],
     )
@@ -280,7 +282,7 @@ async def search_medicine_qa(query: str) -> str:
 
     Returns relevant Q&A content about medications, including dosage, side effects, and interactions.
     """
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     q = query
     try:
         vs, collection_name = _get_vector_store()
@@ -290,7 +292,7 @@ async def search_medicine_qa(query: str) -> str:
             "Retrieve Medicine Information",
             {"query": q},
             err,
-            start,
+            start_ns,
             tags=["healthcare", "error"],
         )
         return json.dumps(err)
@@ -300,7 +302,7 @@ async def search_medicine_qa(query: str) -> str:
         rag_system = get_domain_rag_system("healthcare", 1)
         raw = await rag_system.search(search_q)
     except Exception as e:
-        logging.exception("search_medicine_qa search failed")
+        logger.exception("search_medicine_qa search failed")
         err = {"error": str(e), "query": search_q}
         return json.dumps(err)
 
@@ -310,7 +312,7 @@ async def search_medicine_qa(query: str) -> str:
         "Retrieve Medicine Information",
         {"query": q},
         snippets,
-        start,
+        start_ns,
         metadata={"count": len(snippets), "collection": collection_name},
         tags=["healthcare", "retrieval"],
     )
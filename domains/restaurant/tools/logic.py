@@ -41,12 +41,14 @@ _vector_store: Optional[PGVector] = None
 _embedding_model: Optional[str] = None
 _collection_name_cached: Optional[str] = None
 
+logger = logging.getLogger(__name__)
+
 galileo_logger_key = "galileo_logger_restaurant"
 if st.session_state.get(galileo_logger_key):
-    print(f"[log.py] --> Galileo logger found! {st.session_state[galileo_logger_key]}", flush=True)
     galileo_logger = st.session_state[galileo_logger_key]
+    logger.debug("Galileo logger found: %s", galileo_logger)
 else:
-    print("[log.py] --> Galileo logger not found!", flush=True)
+    logger.debug("Galileo logger not found")
     galileo_logger = None
 
 
@@ -94,7 +96,7 @@ def _log_tool_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
@@ -104,7 +106,7 @@ def _log_tool_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["restaurant"],
     )
@@ -114,25 +116,25 @@ def _log_retriever_span(
     name: str,
     tool_input: dict,
     tool_output: dict,
-    start_time: float,
+    start_ns: int,
     metadata: Optional[dict] = None,
     tags: Optional[List[str]] = None,
 ) -> None:
     global galileo_logger
 
     if not galileo_logger:
-        print("[_log_retriever_span] --> No Galileo logger found", flush=True)
+        logger.debug("No Galileo logger; skipping retriever span %s", name)
         return
 
     galileo_logger.add_retriever_span(
         input=json.dumps(tool_input),
         output=json.dumps(tool_output),
         name=name,
-        duration_ns=int((time.time() - start_time) * 1000000),
+        duration_ns=time.perf_counter_ns() - start_ns,
         metadata=metadata or {},
         tags=tags or ["restaurant"],
     )
-    print(f"[_log_retriever_span] --> Galileo logger found! {galileo_logger.trace_id}_", flush=True)
+    logger.debug("Logged retriever span %s on trace %s", name, galileo_logger.trace_id)
 
 
 def _resolve_galileo_logger(*_args, **_kwargs) -> Optional[GalileoLogger]:
@@ -171,8 +173,8 @@ async def get_schedule_info(period_name: str, user_prompt: str = "") -> str:
 
     Returns period name, person, role, and hours per shift.
     """
-    print(f"get_schedule_info: period_name: {period_name}, user_prompt: {user_prompt}", flush=True)
-    start_time = time.time()
+    logger.debug("get_schedule_info: period_name=%s user_prompt=%s", period_name, user_prompt)
+    start_ns = time.perf_counter_ns()
     period_name = period_name.strip().upper()
 
     q = (period_name or "").strip()
@@ -198,7 +200,7 @@ async def get_schedule_info(period_name: str, user_prompt: str = "") -> str:
     except Exception as e:
         err = {"error": str(e), "period_name": q}
         return json.dumps(err)
-    print(f"get_schedule_info: sql: {sql}", flush=True)
+    logger.debug("get_schedule_info: sql=%s", sql)
     raw = await _execute_schedule_sql(sql)
     try:
         result = json.loads(raw)
@@ -214,7 +216,7 @@ async def get_schedule_info(period_name: str, user_prompt: str = "") -> str:
         "get_schedule_info",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["restaurant", "tool"],
     )
@@ -225,7 +227,7 @@ async def delete_schedule_record(period_id: str) -> str:
     """
     Permanently delete a schedule record from the registry by period ID.
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     # period_name = period_name.strip().upper()
 
     q = (period_id or "").strip()
@@ -267,7 +269,7 @@ async def delete_schedule_record(period_id: str) -> str:
         "delete_schedule_record",
         {"query": q, "sql": sql},
         {"count": result.get("count", 0), "table": table_name},
-        start_time,
+        start_ns,
         metadata={"count": str(result.get("count", 0))},
         tags=["restaurant", "tool", "delete"],
     )
@@ -281,7 +283,7 @@ async def search_kitchen_qa(query: str) -> str:
 
     Returns relevant Q&A content about kitchen operations, including closing checklist, prep sheets, recognition methods, etc.
     """
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     q = query
     try:
         vs, collection_name = _get_vector_store()
@@ -291,7 +293,7 @@ async def search_kitchen_qa(query: str) -> str:
             "Retrieve Kitchen Information",
             {"query": q},
             err,
-            start,
+            start_ns,
             tags=["restaurant", "error"],
         )
         return json.dumps(err)
@@ -301,7 +303,7 @@ async def search_kitchen_qa(query: str) -> str:
         rag_system = get_domain_rag_system("restaurant", 1)
         raw = await rag_system.search(search_q)
     except Exception as e:
-        logging.exception("search_kitchen_qa search failed")
+        logger.exception("search_kitchen_qa search failed")
         err = {"error": str(e), "query": search_q}
         return json.dumps(err)
 
@@ -311,7 +313,7 @@ async def search_kitchen_qa(query: str) -> str:
         "Retrieve Kitchen Information",
         {"query": q},
         snippets,
-        start,
+        start_ns,
         metadata={"count": len(snippets), "collection": collection_name},
         tags=["restaurant", "retrieval"],
     )
@@ -0,0 +1,3 @@
+"""
+Experiment helpers and CLI scripts for running Galileo experiments.
+"""
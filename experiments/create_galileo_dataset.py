@@ -10,62 +10,75 @@ Example:
 """
 
 import sys
-import os
 import argparse
+from pathlib import Path
 
-# Add parent directory to path to import domain_manager
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Make the repo root importable when run as a script; a no-op under
+# `python -m experiments.<script>` where the root is already on sys.path
+_root = str(Path(__file__).resolve().parents[1])
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
-from domain_manager import DomainManager
-from setup_env import setup_environment
-from experiments.experiment_helpers import (
-    read_dataset_csv,
-    create_domain_dataset,
-    get_domain_dataset_name
-)
 
+def run(domain: str, preview: bool = False):
+    """
+    Create (or preview) a domain's Galileo dataset without going through argparse.
 
-def main():
-    parser = argparse.ArgumentParser(description="Create Galileo dataset from domain CSV")
-    parser.add_argument("domain", help="Domain name (e.g., 'finance')")
-    parser.add_argument("--preview", "-p", action="store_true", help="Preview the dataset without creating")
-    
-    args = parser.parse_args()
-    
-    # Use DomainManager to load domain config
-    dm = DomainManager()
-    
-    try:
-        domain_config = dm.load_domain_config(args.domain)
-    except ValueError as e:
-        print(f"Error: {e}")
-        print("Available domains:", dm.list_domains())
-        sys.exit(1)
+    Args:
+        domain: Domain name (e.g., 'finance')
+        preview: Print the first samples instead of creating the dataset
+
+    Returns:
+        Created dataset object, or None when previewing
+
+    Raises:
+        ValueError: If the domain is unknown or its dataset.csv is invalid or empty
+    """
+    # Import the Galileo stack lazily so --help stays fast
+    from experiments.experiment_helpers import (
+        load_cli_domain_config,
+        read_dataset_rows,
+        create_domain_dataset,
+        get_domain_dataset_name
+    )
     
-    # Setup environment with domain-specific settings
-    setup_environment(args.domain, domain_config.config)
+    # Load domain config and apply its environment settings
+    domain_config = load_cli_domain_config(domain)
     
     # Read dataset
-    dataset = read_dataset_csv(domain_config.dataset_file)
+    dataset = read_dataset_rows(domain_config.dataset_file)
     
     if not dataset:
-        print("No data found in dataset.csv")
-        sys.exit(1)
+        raise ValueError("No data found in dataset.csv")
     
-    if args.preview:
+    if preview:
         print(f"Found {len(dataset)} samples")
-        for i, sample in enumerate(dataset[:3]):
+        for i, (sample_input, sample_output) in enumerate(dataset[:3]):
             print(f"\nSample {i+1}:")
-            print(f"Input: {sample['input']}")
-            print(f"Output: {sample['output'][:100]}...")
+            print(f"Input: {sample_input}")
+            print(f"Output: {sample_output[:100]}...")
         return
     
     # Create Galileo dataset
-    dataset_name = get_domain_dataset_name(args.domain)
-    dataset_obj = create_domain_dataset(args.domain, domain_config.dataset_file)
+    dataset_name = get_domain_dataset_name(domain)
+    dataset_obj = create_domain_dataset(domain, domain_config.dataset_file)
     
     print(f"Dataset created: {dataset_name}")
     print(f"ID: {dataset_obj.id}")
+    return dataset_obj
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create Galileo dataset from domain CSV")
+    parser.add_argument("domain", help="Domain name (e.g., 'finance')")
+    parser.add_argument("--preview", "-p", action="store_true", help="Preview the dataset without creating")
+    
+    args = parser.parse_args()
+    try:
+        run(args.domain, preview=args.preview)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,31 @@ Helper functions for running experiments from both CLI and UI.
 """
 import os
 import csv
-from typing import List, Dict, Any, Optional
+import functools
+import logging
+import threading
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from galileo.experiments import run_experiment
 from galileo.datasets import get_dataset, create_dataset, list_datasets
 from galileo_core.schemas.shared.scorers.scorer_name import ScorerName as GalileoScorers
 from galileo import galileo_context
 from galileo.handlers.langchain import GalileoCallback
 
+from domain_manager import DomainManager
+from setup_env import setup_environment
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the csv module
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+# Read buffer for the csv-module path; large reads keep syscalls down on big files
+_CSV_BUFFER_SIZE = 1 << 20
 
 # Default metrics for experiments
 DEFAULT_METRICS = [
@@ -28,6 +46,171 @@ AVAILABLE_METRICS = {
 }
 
 
+def load_cli_domain_config(domain_name: str):
+    """
+    Load a domain's config and apply its environment settings for a CLI script.
+
+    Args:
+        domain_name: Name of the domain
+
+    Returns:
+        DomainConfig for the domain
+
+    Raises:
+        ValueError: If the domain is unknown (the message lists the available domains)
+    """
+    dm = DomainManager()
+
+    try:
+        domain_config = dm.load_domain_config(domain_name)
+    except ValueError as e:
+        raise ValueError(f"{e}\nAvailable domains: {dm.list_domains()}") from e
+
+    # Setup environment with domain-specific settings
+    setup_environment(domain_name, domain_config.config)
+    return domain_config
+
+
+def _read_csv_header(dataset_file: str) -> List[str]:
+    # utf-8-sig drops the BOM that Excel exports and browser uploads often carry
+    with open(dataset_file, 'r', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f), None) or []
+
+
+def _iter_dataset_rows_arrow(dataset_file: str, batch_size: int) -> Iterator[List[Tuple[str, str]]]:
+    """pyarrow path: native tokenizing and whitespace trimming of the two needed columns."""
+    reader = pa_csv.open_csv(
+        dataset_file,
+        # Rows whose field count differs from the header raise ArrowInvalid and
+        # are handed to the csv module (see _iter_dataset_rows)
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=['input', 'output'],
+            column_types={'input': pa.string(), 'output': pa.string()},
+            strings_can_be_null=False,
+        ),
+    )
+    batch: List[Tuple[str, str]] = []
+    for record_batch in reader:
+        inputs = pc.utf8_trim_whitespace(record_batch.column('input')).to_pylist()
+        outputs = pc.utf8_trim_whitespace(record_batch.column('output')).to_pylist()
+        for row in zip(inputs, outputs):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _iter_dataset_rows_stdlib(dataset_file: str, batch_size: int) -> Iterator[List[Tuple[str, str]]]:
+    """csv-module fallback used when pyarrow is not installed."""
+    # newline='' lets the csv module handle line endings (and newlines in quoted fields)
+    with open(dataset_file, 'r', encoding='utf-8-sig', newline='', buffering=_CSV_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+
+        # Resolve column positions once instead of building a dict per row.
+        input_idx = header.index('input')
+        output_idx = header.index('output')
+        min_width = max(input_idx, output_idx) + 1
+        strip = str.strip
+
+        batch: List[Tuple[str, str]] = []
+        for row in reader:
+            # Blank lines and rows that stop before input/output are skipped; other
+            # missing or extra trailing fields don't matter
+            if len(row) < min_width:
+                continue
+            batch.append((strip(row[input_idx]), strip(row[output_idx])))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _iter_dataset_rows(dataset_file: str, batch_size: int) -> Iterator[List[Tuple[str, str]]]:
+    """Validate the header, then stream (input, output) tuples in batches."""
+    # Validate the columns once from the header rather than checking every row
+    header = _read_csv_header(dataset_file)
+    missing = [column for column in ('input', 'output') if column not in header]
+    if missing:
+        raise ValueError(
+            f"Dataset file is missing required column(s) {missing}; found {header}"
+        )
+
+    if pa_csv is None:
+        yield from _iter_dataset_rows_stdlib(dataset_file, batch_size)
+        return
+
+    rows_yielded = 0
+    try:
+        for batch in _iter_dataset_rows_arrow(dataset_file, batch_size):
+            yield batch
+            rows_yielded += len(batch)
+    except pa.ArrowInvalid:
+        # A row's field count differs from the header (e.g. an unquoted comma or a
+        # dropped trailing column). Finish with the csv module, which keeps such
+        # rows, resuming after the rows already yielded; pyarrow only yields rows
+        # before the first ragged one, so both readers agree up to that point.
+        logger.info("Re-reading %s with the csv module (ragged row)", dataset_file)
+        remaining = islice(chain.from_iterable(
+            _iter_dataset_rows_stdlib(dataset_file, batch_size)
+        ), rows_yielded, None)
+        while True:
+            batch = list(islice(remaining, batch_size))
+            if not batch:
+                break
+            yield batch
+
+
+def _rows_to_records(rows: Iterable[Tuple[str, str]]) -> List[Dict[str, str]]:
+    return [{'input': input_text, 'output': output_text} for input_text, output_text in rows]
+
+
+def iter_dataset_csv(dataset_file: str, batch_size: int = 1000) -> Iterator[List[Dict[str, str]]]:
+    """
+    Stream a CSV file as batches of input/output pairs.
+
+    Only one batch is held in memory at a time, so large dataset files can be
+    processed without materializing every row up front. Parsing uses pyarrow's
+    C++ CSV reader when available and the csv module otherwise (also used for
+    files with rows whose field count differs from the header, which pyarrow
+    cannot parse). Rows with fewer fields than the header are kept
+    as long as they reach the input and output columns. Blank lines and rows
+    that stop before either column are skipped.
+
+    Args:
+        dataset_file: Path to the CSV file
+        batch_size: Maximum number of rows per yielded batch
+
+    Yields:
+        Lists of dictionaries with 'input' and 'output' keys
+
+    Raises:
+        ValueError: If the header has no 'input' or 'output' column
+    """
+    for batch in _iter_dataset_rows(dataset_file, batch_size):
+        yield _rows_to_records(batch)
+
+
+def read_dataset_rows(dataset_file: str) -> List[Tuple[str, str]]:
+    """
+    Read a CSV file and return compact (input, output) tuples.
+
+    Args:
+        dataset_file: Path to the CSV file
+
+    Returns:
+        List of (input, output) tuples
+
+    Raises:
+        ValueError: If the header has no 'input' or 'output' column
+    """
+    return list(chain.from_iterable(_iter_dataset_rows(dataset_file, 1000)))
+
+
 def read_dataset_csv(dataset_file: str) -> List[Dict[str, str]]:
     """
     Read a CSV file and return list of input/output pairs.
@@ -37,17 +220,11 @@ def read_dataset_csv(dataset_file: str) -> List[Dict[str, str]]:
         
     Returns:
         List of dictionaries with 'input' and 'output' keys
+
+    Raises:
+        ValueError: If the header has no 'input' or 'output' column
     """
-    dataset = []
-    with open(dataset_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if 'input' in row and 'output' in row:
-                dataset.append({
-                    'input': row['input'].strip(),
-                    'output': row['output'].strip()
-                })
-    return dataset
+    return list(chain.from_iterable(iter_dataset_csv(dataset_file)))
 
 
 def create_domain_dataset(domain_name: str, dataset_file: str, custom_name: Optional[str] = None) -> Any:
@@ -62,11 +239,14 @@ def create_domain_dataset(domain_name: str, dataset_file: str, custom_name: Opti
     Returns:
         Created dataset object
     """
-    dataset_content = read_dataset_csv(dataset_file)
+    rows = read_dataset_rows(dataset_file)
     
-    if not dataset_content:
+    if not rows:
         raise ValueError("No data found in dataset file")
 
+    # Rows stay as tuples until the upload boundary, where the SDK needs records
+    dataset_content = _rows_to_records(rows)
+
     project = os.environ.get("GALILEO_PROJECT", "default")    
     dataset_name = custom_name if custom_name else get_domain_dataset_name(domain_name)
     try:
@@ -77,8 +257,9 @@ def create_domain_dataset(domain_name: str, dataset_file: str, custom_name: Opti
     return dataset
 
 
+@functools.lru_cache(maxsize=None)
 def get_domain_dataset_name(domain_name: str) -> str:
-    """Get the standardized dataset name for a domain."""
+    """Get the standardized dataset name for a domain (memoized; domains are few)."""
     return f"{domain_name.title()} Domain Dataset"
 
 
@@ -136,32 +317,63 @@ def create_experiment_function(
     Returns:
         Function that can be called for each experiment row
     """
+    # One agent (and experiment callback) per worker thread: rows reuse them
+    # instead of rebuilding per row, while concurrent rows never share an instance.
+    thread_state = threading.local()
+
+    def get_thread_agent():
+        agent = getattr(thread_state, "agent", None)
+        if agent is None:
+            agent = agent_factory.create_agent(
+                domain_name,
+                "LangGraph",
+                model_name=model_name,
+                llm_provider=llm_provider,
+            )
+            thread_state.agent = agent
+        return agent
+
+    def get_thread_callback(galileo_logger):
+        # Rows on the same thread run one at a time, so they can share a callback
+        callback = getattr(thread_state, "callback", None)
+        if callback is None or thread_state.callback_logger is not galileo_logger:
+            # Create callback that doesn't start/flush traces when in experiment
+            callback = GalileoCallback(
+                galileo_logger,
+                start_new_trace=False,
+                flush_on_chain_end=False
+            )
+            thread_state.callback = callback
+            thread_state.callback_logger = galileo_logger
+        return callback
+
+    # The experiment logger is only available once run_experiment has started,
+    # so it is resolved on the first row and reused for the rest of the run.
+    experiment_logger = None
+
+    def get_experiment_logger():
+        nonlocal experiment_logger
+        if experiment_logger is None:
+            experiment_logger = galileo_context.get_logger_instance()
+        return experiment_logger
+
     def experiment_function(input_data):
         """
         Function that will be called for each row in the dataset.
         This uses the existing agent infrastructure.
         """
-        # Get the current logger to check if we're in an experiment
-        galileo_logger = galileo_context.get_logger_instance()
+        # Each row runs under its own experiment trace, so the parent check stays per row
+        galileo_logger = get_experiment_logger()
         is_in_experiment = galileo_logger.current_parent() is not None
         
-        # Create the agent using the existing factory (with optional model override)
-        agent = agent_factory.create_agent(
-            domain_name,
-            "LangGraph",
-            model_name=model_name,
-            llm_provider=llm_provider,
-        )
+        # Reuse this thread's agent (created on first use, with optional model override)
+        agent = get_thread_agent()
         
-        # Override the agent's config to use the proper callback for experiments
+        # Use the experiment callback for this call only; the cached agent is left untouched
+        run_config = None
         if is_in_experiment:
-            # Create callback that doesn't start/flush traces when in experiment
-            galileo_callback = GalileoCallback(
-                galileo_logger,
-                start_new_trace=False,
-                flush_on_chain_end=False
-            )
-            agent.config = {
+            galileo_callback = get_thread_callback(galileo_logger)
+            run_config = {
                 "configurable": {"thread_id": agent.session_id}, 
                 "callbacks": [galileo_callback]
             }
@@ -176,7 +388,7 @@ def create_experiment_function(
         # Run the agent with the input
         # The agent will handle logging automatically
         messages = [{"role": "user", "content": user_input}]
-        response = agent.process_query(messages)
+        response = agent.process_query(messages, config=run_config)
         
         return response
     
@@ -10,80 +10,98 @@ Example:
 """
 
 import sys
-import os
 import argparse
+from pathlib import Path
+from typing import Optional
 
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Make the repo root importable when run as a script; a no-op under
+# `python -m experiments.<script>` where the root is already on sys.path
+_root = str(Path(__file__).resolve().parents[1])
+if _root not in sys.path:
+    sys.path.insert(0, _root)
 
-from domain_manager import DomainManager
-from setup_env import setup_environment
-from agent_factory import AgentFactory
-from experiments.experiment_helpers import (
-    get_domain_dataset_name,
-    get_dataset_by_name,
-    run_domain_experiment,
-    DEFAULT_METRICS
-)
+# Emoji status markers only when writing to a terminal; plain ASCII when piped (e.g. CI logs)
+_SUCCESS_MARK, _ERROR_MARK = ("✅", "❌") if sys.stdout.isatty() else ("[OK]", "[ERROR]")
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Run Galileo experiment for a domain")
-    parser.add_argument("domain", help="Domain name (e.g., 'finance')")
-    parser.add_argument("--experiment-name", help="Custom experiment name", default=None)
-    
-    args = parser.parse_args()
-    
-    # Use DomainManager to load domain config
-    dm = DomainManager()
-    
-    try:
-        domain_config = dm.load_domain_config(args.domain)
-    except ValueError as e:
-        print(f"Error: {e}")
-        print("Available domains:", dm.list_domains())
-        sys.exit(1)
+def run(domain: str, experiment_name: Optional[str] = None):
+    """
+    Run an experiment for a domain without going through argparse.
+
+    Args:
+        domain: Domain name (e.g., 'finance')
+        experiment_name: Custom experiment name (defaults to '<domain>-experiment')
+
+    Returns:
+        Experiment results
+
+    Raises:
+        ValueError: If the domain is unknown or its dataset cannot be loaded
+    """
+    # Import the agent/Galileo stack lazily so --help stays fast
+    from agent_factory import AgentFactory
+    from experiments.experiment_helpers import (
+        load_cli_domain_config,
+        get_domain_dataset_name,
+        get_dataset_by_name,
+        run_domain_experiment,
+        DEFAULT_METRICS
+    )
     
-    # Setup environment with domain-specific settings
-    setup_environment(args.domain, domain_config.config)
+    # Load domain config and apply its environment settings
+    load_cli_domain_config(domain)
     
     # Create experiment name
-    experiment_name = args.experiment_name or f"{args.domain}-experiment"
+    experiment_name = experiment_name or f"{domain}-experiment"
     
     # Get the dataset
-    dataset_name = get_domain_dataset_name(args.domain)
+    dataset_name = get_domain_dataset_name(domain)
     
     try:
         dataset = get_dataset_by_name(dataset_name)
         print(f"Found dataset: {dataset_name}")
     except Exception as e:
-        print(f"Error loading dataset '{dataset_name}': {e}")
-        print("Make sure you've created the dataset first using create_galileo_dataset.py")
-        sys.exit(1)
+        raise ValueError(
+            f"Error loading dataset '{dataset_name}': {e}\n"
+            "Make sure you've created the dataset first using create_galileo_dataset.py"
+        ) from e
     
     # Create agent factory
     agent_factory = AgentFactory()
     
-    print(f"Running experiment: {experiment_name}")
-    print(f"Domain: {args.domain}")
-    print(f"Dataset: {dataset_name}")
-    print(f"Metrics: {[m.name for m in DEFAULT_METRICS]}")
+    print(
+        f"Running experiment: {experiment_name}\n"
+        f"Domain: {domain}\n"
+        f"Dataset: {dataset_name}\n"
+        f"Metrics: {[m.name for m in DEFAULT_METRICS]}"
+    )
     
     # Run the experiment
+    results = run_domain_experiment(
+        domain_name=domain,
+        experiment_name=experiment_name,
+        dataset=dataset,
+        agent_factory=agent_factory,
+        metrics=DEFAULT_METRICS
+    )
+    
+    print(f"{_SUCCESS_MARK} Experiment completed successfully!\nResults: {results}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Galileo experiment for a domain")
+    parser.add_argument("domain", help="Domain name (e.g., 'finance')")
+    parser.add_argument("--experiment-name", help="Custom experiment name", default=None)
+    
+    args = parser.parse_args()
     try:
-        results = run_domain_experiment(
-            domain_name=args.domain,
-            experiment_name=experiment_name,
-            dataset=dataset,
-            agent_factory=agent_factory,
-            metrics=DEFAULT_METRICS
-        )
-        
-        print("✅ Experiment completed successfully!")
-        print(f"Results: {results}")
-        
+        run(args.domain, experiment_name=args.experiment_name)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     except Exception as e:
-        print(f"❌ Error running experiment: {e}")
+        print(f"{_ERROR_MARK} Error running experiment: {e}")
         sys.exit(1)
 
 
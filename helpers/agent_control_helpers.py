@@ -13,6 +13,9 @@ from agent_control.settings import configure_settings
 from galileo.log_streams import get_log_stream
 
 _initialized = False
+# Log stream IDs resolved for Agent Control, keyed by (console URL, project, log stream),
+# so re-initializing for a new session or a forced refresh skips the lookup round-trip.
+_LOG_STREAM_IDS: dict = {}
 MAX_STEER_RETRIES = 3
 STEER_EXHAUSTED_MESSAGE = (
     "Agent could not complete the request after "
@@ -295,16 +298,9 @@ def wrap_controlled_tool(
             try:
                 return await func(*args, **kwargs)
             except ControlViolationError as e:
-                notify_control_block(e, step_name=step)
-                return json.dumps(
-                    {
-                        "error": format_blocked_message(e, step),
-                        "blocked_by_agent_control": True,
-                    }
-                )
+                return _handle_control_error(e, step_name=step)
             except ControlSteerError as e:
-                notify_control_block(e, step_name=step, guardrail_result="steered")
-                return format_steer_tool_result(e)
+                return _handle_control_error(e, step_name=step, steered=True)
 
         return async_wrapper
 
@@ -313,16 +309,9 @@ def wrap_controlled_tool(
         try:
             return func(*args, **kwargs)
         except ControlViolationError as e:
-            notify_control_block(e, step_name=step)
-            return json.dumps(
-                {
-                    "error": format_blocked_message(e, step),
-                    "blocked_by_agent_control": True,
-                }
-            )
+            return _handle_control_error(e, step_name=step)
         except ControlSteerError as e:
-            notify_control_block(e, step_name=step, guardrail_result="steered")
-            return format_steer_tool_result(e)
+            return _handle_control_error(e, step_name=step, steered=True)
 
     return sync_wrapper
 
@@ -421,11 +410,16 @@ def init_agent_control(
 
     # Control spans require galileo_logger.enable_agent_control() (done in app.py).
 
-    try:
-        log_stream_data = get_log_stream(name=log_stream, project_name=project_name)
-    except Exception as e:
-        print(f"⚠️ Agent Control: failed to resolve log stream '{log_stream}': {e}")
-        return False
+    log_stream_key = (os.environ.get("GALILEO_CONSOLE_URL"), project_name, log_stream)
+    log_stream_id = _LOG_STREAM_IDS.get(log_stream_key)
+    if log_stream_id is None:
+        try:
+            log_stream_data = get_log_stream(name=log_stream, project_name=project_name)
+            log_stream_id = log_stream_data.id
+        except Exception as e:
+            print(f"⚠️ Agent Control: failed to resolve log stream '{log_stream}': {e}")
+            return False
+        _LOG_STREAM_IDS[log_stream_key] = log_stream_id
 
     control_steps = steps or STANDARD_AGENT_CONTROL_STEPS
 
@@ -444,7 +438,7 @@ def init_agent_control(
         observability_enabled=True,
         observability_sink_name="registered",
         target_type="log_stream",
-        target_id=log_stream_data.id,
+        target_id=log_stream_id,
         steps=control_steps,
     )
     _initialized = True
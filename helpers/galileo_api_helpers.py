@@ -4,11 +4,64 @@ Galileo API Helper Functions
 These helpers load only the API key and console URL from secrets.
 Domain-specific environment setup (like project names) is handled by the main app.
 """
+import functools
 import requests
 import logging
 import os
+import re
+import threading
 import toml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+# Shared session so repeated lookups reuse pooled keep-alive connections to the
+# Galileo API instead of paying a new TCP+TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.headers.update({
+    "accept": "*/*",
+    "content-type": "application/json",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
+})
+
+
+# Resolved IDs keyed by (console URL, name). IDs never change once created, so
+# hits are kept for the process lifetime; misses are not cached because the
+# project or log stream may be created later (e.g. by the SDK on first log).
+_PROJECT_ID_CACHE: Dict[Tuple[str, str], str] = {}
+_LOG_STREAM_ID_CACHE: Dict[Tuple[str, str, str], str] = {}
+_ID_CACHE_LOCK = threading.Lock()
+
+
+# Bare host of a console URL, e.g. "https://app.galileo.ai/foo" -> "galileo.ai"
+_CONSOLE_DOMAIN_RE = re.compile(r"^(?:https?://)?(?:app\.)?([^/]*)")
+
+
+def _request_headers(api_key: str, galileo_url: str) -> dict:
+    """Per-request headers; the static ones live on the shared session."""
+    return {
+        "galileo-api-key": api_key,
+        "origin": galileo_url,
+        "referer": f"{galileo_url}/",
+    }
 
 
 def _load_secrets_if_needed():
@@ -70,21 +123,14 @@ def get_galileo_api_url() -> str:
     Raises:
         ValueError: If GALILEO_CONSOLE_URL is not set
     """
-    galileo_url = get_galileo_app_url()
-    
-    # Extract domain without protocol
-    if galileo_url.startswith("https://"):
-        domain = galileo_url[8:]  # Remove https://
-    elif galileo_url.startswith("http://"):
-        domain = galileo_url[7:]  # Remove http://
-    else:
-        domain = galileo_url
-    
-    # Remove app. prefix if exists and any path components
-    if domain.startswith("app."):
-        domain = domain[4:]
-    domain = domain.split('/')[0]  # Get just the domain part
-    
+    return _derive_api_url(get_galileo_app_url())
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_api_url(galileo_url: str) -> str:
+    """Map a console URL to its API URL (memoized per console URL)."""
+    # Drop the protocol, any app. prefix and path components in one match
+    domain = _CONSOLE_DOMAIN_RE.match(galileo_url).group(1)
     return f"https://api.{domain}"
 
 
@@ -116,7 +162,7 @@ def get_galileo_project_id(project_name: str, starting_token: int = 0, limit: in
         limit (int): The number of projects to fetch.
 
     Returns:
-        str: The project ID if found, else None.
+        str: The project ID if found, else None. Found IDs are cached per console URL.
         
     Raises:
         ValueError: If required environment variables are not set
@@ -124,31 +170,38 @@ def get_galileo_project_id(project_name: str, starting_token: int = 0, limit: in
     """
     api_key = get_galileo_api_key()
     galileo_url = get_galileo_app_url()
+
+    cache_key = (galileo_url, project_name)
+    with _ID_CACHE_LOCK:
+        cached_id = _PROJECT_ID_CACHE.get(cache_key)
+    if cached_id:
+        return cached_id
     
     url = f"{galileo_url}/api/galileo/public/v2/projects/paginated?starting_token={starting_token}&limit={limit}"
-    headers = {
-        "accept": "*/*",
-        "galileo-api-key": api_key,
-        "content-type": "application/json",
-        "origin": galileo_url,
-        "referer": f"{galileo_url}/",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
-    }
+    headers = _request_headers(api_key, galileo_url)
     data = {
         "sort": {
             "name": "updated_at",
             "ascending": False
         },
-        "filters": []
+        # Match the name server-side so the project comes back in one request
+        # regardless of how many projects the org has
+        "filters": [
+            {"name": "name", "operator": "eq", "value": project_name, "case_sensitive": True}
+        ]
     }
-    response = requests.post(url, headers=headers, json=data)
+    # Body is pre-encoded; the session already sends content-type: application/json
+    response = _SESSION.post(url, headers=headers, data=_dumps(data))
     response.raise_for_status()
-    result = response.json()
+    result = _loads(response.content)
+    # Exact-name check kept as a safety net in case the filter is ignored
     for project in result.get("projects", []):
         if project.get("name") == project_name:
-            return project.get("id")
+            project_id = project.get("id")
+            if project_id:
+                with _ID_CACHE_LOCK:
+                    _PROJECT_ID_CACHE[cache_key] = project_id
+            return project_id
     return None
 
 
@@ -180,7 +233,7 @@ def get_galileo_log_stream_id(project_id: str, log_stream_name: str) -> str:
         log_stream_name (str): The name of the log stream to search for.
 
     Returns:
-        str: The log stream ID if found, else None.
+        str: The log stream ID if found, else None. Found IDs are cached per console URL.
         
     Raises:
         ValueError: If required environment variables are not set
@@ -188,24 +241,64 @@ def get_galileo_log_stream_id(project_id: str, log_stream_name: str) -> str:
     """
     api_key = get_galileo_api_key()
     galileo_url = get_galileo_app_url()
+
+    cache_key = (galileo_url, project_id, log_stream_name)
+    with _ID_CACHE_LOCK:
+        cached_id = _LOG_STREAM_ID_CACHE.get(cache_key)
+    if cached_id:
+        return cached_id
     
     url = f"{galileo_url}/api/galileo/v2/projects/{project_id}/log_streams"
-    headers = {
-        "accept": "*/*",
-        "galileo-api-key": api_key,
-        "content-type": "application/json",
-        "origin": galileo_url,
-        "referer": f"{galileo_url}/",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-        "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36"
-    }
+    headers = _request_headers(api_key, galileo_url)
     
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
     response.raise_for_status()
-    log_streams = response.json()  # This is now a list of log streams
+    log_streams = _loads(response.content)  # This is now a list of log streams
     
-    for stream in log_streams:  # Iterate directly over the list
-        if stream.get("name") == log_stream_name:
-            return stream.get("id")
-    return None
+    # Cache every stream in the listing so sibling domains sharing this project
+    # resolve their log streams without another request
+    found = {
+        stream.get("name"): stream.get("id")
+        for stream in log_streams  # Iterate directly over the list
+        if stream.get("name") and stream.get("id")
+    }
+    with _ID_CACHE_LOCK:
+        for name, stream_id in found.items():
+            _LOG_STREAM_ID_CACHE[(galileo_url, project_id, name)] = stream_id
+    return found.get(log_stream_name)
+
+
+def prefetch_galileo_ids(targets: Iterable[Tuple[str, str]], max_workers: int = 8) -> None:
+    """
+    Resolve project and log stream IDs for several domains concurrently.
+
+    Each distinct project is resolved on its own thread, so warming the ID
+    caches for every domain costs roughly one lookup chain rather than one per
+    domain. Failures are logged and skipped; the normal lookups retry later.
+
+    Args:
+        targets: (project name, log stream name) pairs, e.g. one per domain
+        max_workers: Upper bound on concurrent lookups
+    """
+    streams_by_project: Dict[str, List[str]] = {}
+    for project_name, log_stream_name in targets:
+        streams_by_project.setdefault(project_name, []).append(log_stream_name)
+    if not streams_by_project:
+        return
+
+    def _resolve(project_name: str, log_stream_names: List[str]) -> None:
+        project_id = get_galileo_project_id(project_name)
+        if project_id:
+            for log_stream_name in log_stream_names:
+                get_galileo_log_stream_id(project_id, log_stream_name)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(streams_by_project))) as executor:
+        futures = {
+            executor.submit(_resolve, project_name, log_stream_names): project_name
+            for project_name, log_stream_names in streams_by_project.items()
+        }
+        for future, project_name in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logging.warning(f"Could not prefetch Galileo IDs for project '{project_name}': {e}")
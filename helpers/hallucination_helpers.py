@@ -6,14 +6,121 @@ for demonstration purposes. Each domain can define hallucination examples
 in their config.yaml under the `demo_hallucinations` key.
 """
 import os
-import uuid
+import secrets
 import logging
-from typing import Optional, List, Dict, Any, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Optional, List, Dict, Any, Tuple, Union
 from galileo import GalileoLogger
 from helpers.galileo_api_helpers import create_galileo_logger
 
 logger = logging.getLogger(__name__)
 
+# Demo loggers keyed by (project, log stream), created once and reused so each
+# demo run skips the project/log-stream resolution and logger setup. Each entry
+# carries a lock so concurrent demo runs don't interleave traces on one logger.
+_DEMO_LOGGERS: Dict[Tuple[str, str], Tuple[GalileoLogger, threading.Lock]] = {}
+_DEMO_LOGGERS_LOCK = threading.Lock()
+
+# Uploads for the cached demo loggers run in the background so the caller returns
+# without waiting on the network. The latest flush per logger is kept so the next
+# demo run on that logger waits for it before starting a new session. The pool's
+# worker threads are joined at interpreter exit, so queued uploads still complete.
+_FLUSH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hallucination-flush")
+_PENDING_FLUSHES: Dict[Tuple[str, str], Future] = {}
+
+_LLM_INPUT_PREFIX = (
+    "Human: You are a helpful assistant. "
+    "Given the context below, please answer the following question:"
+)
+_CONTEXT_SEPARATOR = "\n\n"
+
+
+def _get_demo_logger(project_name: str, log_stream: str) -> Tuple[GalileoLogger, threading.Lock]:
+    """Return the cached demo logger (and its lock) for a project/log stream."""
+    key = (project_name, log_stream)
+    with _DEMO_LOGGERS_LOCK:
+        entry = _DEMO_LOGGERS.get(key)
+        if entry is None:
+            galileo_logger = create_galileo_logger(project_name, log_stream)
+            galileo_logger.enable_agent_control()
+            entry = (galileo_logger, threading.Lock())
+            _DEMO_LOGGERS[key] = entry
+    return entry
+
+
+def _evict_demo_logger(project_name: str, log_stream: str, galileo_logger: GalileoLogger) -> None:
+    """Drop a cached demo logger (e.g. one left with an open trace) so the next call starts clean."""
+    key = (project_name, log_stream)
+    with _DEMO_LOGGERS_LOCK:
+        entry = _DEMO_LOGGERS.get(key)
+        if entry is not None and entry[0] is galileo_logger:
+            del _DEMO_LOGGERS[key]
+
+
+def _log_flush_failure(future: Future) -> None:
+    """Done-callback for background flushes; no caller waits on the result, so report errors here."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to flush hallucination trace: {error}")
+
+
+def _log_hallucination_trace(
+    galileo_logger: GalileoLogger,
+    question: str,
+    context_docs: List[str],
+    hallucinated_answer: str,
+    model: str,
+) -> None:
+    """Log the retriever + LLM hallucination trace (the caller flushes)."""
+    # Start a workflow trace
+    galileo_logger.start_trace(
+        input=question,
+        name="Hallucination Demo",
+    )
+    
+    # Add retriever span with the real context
+    galileo_logger.add_retriever_span(
+        input=question,
+        output=context_docs,
+        name="RAG Retrieval",
+        duration_ns=int(1.3e8),
+        status_code=200
+    )
+    
+    # Build the LLM input with context in one join so large contexts are copied once
+    llm_input = _CONTEXT_SEPARATOR.join(
+        [_LLM_INPUT_PREFIX, *context_docs, f"Question: {question}"]
+    )
+    
+    # Rough token estimates (2 per word), computed once for the three span fields
+    num_input_tokens = len(llm_input.split()) * 2
+    num_output_tokens = len(hallucinated_answer.split()) * 2
+
+    # Add LLM span with the hallucinated answer
+    galileo_logger.add_llm_span(
+        input=llm_input,
+        output=hallucinated_answer,
+        model=model,
+        name="LLM Response",
+        num_input_tokens=num_input_tokens,
+        num_output_tokens=num_output_tokens,
+        total_tokens=num_input_tokens + num_output_tokens,
+        duration_ns=int(1.2e8),
+        metadata={"temperature": "0.1", "demo_type": "hallucination"},
+        temperature=0.1,
+        status_code=200,
+        time_to_first_token_ns=500000,
+    )
+    
+    # Conclude the trace
+    galileo_logger.conclude(
+        output=hallucinated_answer,
+        duration_ns=int(2.5e8),
+        status_code=200
+    )
+
 
 def log_hallucination(
     project_name: str,
@@ -24,6 +131,7 @@ def log_hallucination(
     model: str = "gemma4",
     session_name: str = "Hallucination Demo",
     existing_logger: Optional[Union[GalileoLogger, Any]] = None,
+    sync: bool = False,
 ) -> bool:
     """
     Log a hallucination trace to Galileo for demonstration purposes.
@@ -41,14 +149,18 @@ def log_hallucination(
         model: The model name to log (default: gpt-4o)
         session_name: Name for the Galileo session (default: "Hallucination Demo")
         existing_logger: Optional existing logger or context to reuse (if session already started)
+        sync: Flush before returning; an existing logger is always flushed synchronously
         
     Returns:
-        bool: True if logging succeeded, False otherwise
+        bool: True if logging succeeded, False otherwise. Without sync, True means
+        the trace was logged and its upload queued; a failed upload is only logged.
     """
+    galileo_logger = None
+    created_new_session = False
     try:
         logger.info(f"Logging hallucination to project: {project_name}, log stream: {log_stream}")
         
-        # Use existing logger if provided, otherwise create a new one
+        # Use existing logger if provided, otherwise reuse the cached demo logger
         if existing_logger:
             logger.info("Using existing Galileo session for hallucification demo")
             # If it's a GalileoDecorator (galileo_context), get the logger instance
@@ -58,71 +170,42 @@ def log_hallucination(
             else:
                 galileo_logger = existing_logger
             created_new_session = False
+            logger_lock = nullcontext()
         else:
             logger.info("Creating new Galileo session for hallucination demo")
-            # Initialize Galileo logger
-            galileo_logger = create_galileo_logger(project_name, log_stream)
-            galileo_logger.enable_agent_control()
-            # Start a named session for easy identification
-            session_id = str(uuid.uuid4())[:10]
-            galileo_logger.start_session(name=session_name, external_id=session_id)
+            galileo_logger, logger_lock = _get_demo_logger(project_name, log_stream)
             created_new_session = True
-        
-        # Start a workflow trace
-        galileo_logger.start_trace(
-            input=question,
-            name="Hallucination Demo",
-        )
-        
-        # Add retriever span with the real context
-        galileo_logger.add_retriever_span(
-            input=question,
-            output=context_docs,
-            name="RAG Retrieval",
-            duration_ns=int(1.3e8),
-            status_code=200
-        )
-        
-        # Build the LLM input with context
-        context_text = "\n\n".join(context_docs)
-        llm_input = f"""Human: You are a helpful assistant. Given the context below, please answer the following question:
 
-{context_text}
+        with logger_lock:
+            if created_new_session:
+                # Let the previous upload on this logger finish before starting a new session
+                pending_flush = _PENDING_FLUSHES.pop((project_name, log_stream), None)
+                if pending_flush is not None:
+                    # exception() waits without re-raising; a failure was already logged
+                    pending_flush.exception()
 
-Question: {question}"""
-        
-        # Add LLM span with the hallucinated answer
-        galileo_logger.add_llm_span(
-            input=llm_input,
-            output=hallucinated_answer,
-            model=model,
-            name="LLM Response",
-            num_input_tokens=len(llm_input.split()) * 2,  # Rough estimate
-            num_output_tokens=len(hallucinated_answer.split()) * 2,
-            total_tokens=len(llm_input.split()) * 2 + len(hallucinated_answer.split()) * 2,
-            duration_ns=int(1.2e8),
-            metadata={"temperature": "0.1", "demo_type": "hallucination"},
-            temperature=0.1,
-            status_code=200,
-            time_to_first_token_ns=500000,
-        )
-        
-        # Conclude the trace
-        galileo_logger.conclude(
-            output=hallucinated_answer,
-            duration_ns=int(2.5e8),
-            status_code=200
-        )
-        
-        # Only flush if we created a new session
-        # if created_new_session:
-        galileo_logger.flush()
+                # Start a named session for easy identification
+                session_id = secrets.token_hex(5)
+                galileo_logger.start_session(name=session_name, external_id=session_id)
+
+            _log_hallucination_trace(galileo_logger, question, context_docs, hallucinated_answer, model)
+
+            # Flush every time, including on a reused logger, so the demo trace shows up promptly
+            if created_new_session and not sync:
+                pending_flush = _FLUSH_POOL.submit(galileo_logger.flush)
+                pending_flush.add_done_callback(_log_flush_failure)
+                _PENDING_FLUSHES[(project_name, log_stream)] = pending_flush
+            else:
+                galileo_logger.flush()
         
         logger.info(f"Successfully logged hallucination to project: {project_name}")
         return True
         
     except Exception as e:
         logger.error(f"Failed to log hallucination: {e}")
+        if created_new_session and galileo_logger is not None:
+            # The cached logger may still hold a half-logged trace; replace it next time
+            _evict_demo_logger(project_name, log_stream, galileo_logger)
         return False
 
 
@@ -132,6 +215,7 @@ def log_hallucination_for_domain(
     rag_retriever_func: Optional[callable] = None,
     hallucination_index: int = 0,
     existing_logger: Optional[Union[GalileoLogger, Any]] = None,
+    sync: bool = False,
 ) -> bool:
     """
     Log a hallucination for a specific domain using its config.
@@ -146,6 +230,7 @@ def log_hallucination_for_domain(
         rag_retriever_func: Optional function to retrieve real context from RAG
         hallucination_index: Which hallucination example to use (default: 0)
         existing_logger: Optional existing logger or context to reuse (if session already started)
+        sync: Wait for the upload so the result covers it (see log_hallucination)
         
     Returns:
         bool: True if logging succeeded, False otherwise
@@ -197,5 +282,6 @@ def log_hallucination_for_domain(
         hallucinated_answer=hallucinated_answer,
         session_name=session_name,
         existing_logger=existing_logger,
+        sync=sync,
     )
 
@@ -1,12 +1,13 @@
 """
 LLM and embedding helpers for local (Ollama) and hosted (OpenAI) inference.
 """
+import functools
 import json
 import os
 import urllib.error
 import urllib.request
 from contextvars import ContextVar, Token
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Set, Tuple
 
 from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -21,6 +22,10 @@ DEFAULT_HOSTED_EMBEDDING_MODEL = "text-embedding-3-large"
 
 _llm_provider_ctx: ContextVar[LLMProvider] = ContextVar("llm_provider", default="local")
 
+# (Ollama URL, model) pairs already confirmed installed. Only hits are kept: a
+# missing model is re-checked next time, since the user may pull it meanwhile.
+_CONFIRMED_OLLAMA_MODELS: Set[Tuple[str, str]] = set()
+
 
 def set_llm_provider(provider: LLMProvider) -> Token:
     """Set the active LLM provider for the current async/task context."""
@@ -102,6 +107,10 @@ def list_ollama_models() -> List[str]:
 
 def ensure_ollama_model_available(model: str, *, model_kind: str = "model") -> None:
     """Raise a clear error if the requested Ollama model is not installed locally."""
+    cache_key = (get_ollama_base_url(), model)
+    if cache_key in _CONFIRMED_OLLAMA_MODELS:
+        return
+
     installed_models = set(list_ollama_models())
     if model not in installed_models:
         raise ValueError(
@@ -109,6 +118,7 @@ def ensure_ollama_model_available(model: str, *, model_kind: str = "model") -> N
             f"Pull it with:\n\n  ollama pull {model}\n\n"
             f"Installed models: {', '.join(sorted(installed_models)) or '(none)'}"
         )
+    _CONFIRMED_OLLAMA_MODELS.add(cache_key)
 
 
 def get_domain_chat_model(domain_config: dict, *, override: Optional[str] = None) -> str:
@@ -175,4 +185,16 @@ def get_embeddings(
         return OpenAIEmbeddings(model=embedding_model)
 
     ensure_ollama_model_available(embedding_model, model_kind="embedding model")
-    return OllamaEmbeddings(model=embedding_model, base_url=get_ollama_base_url())
+    return _ollama_embeddings(embedding_model, get_ollama_base_url())
+
+
+@functools.lru_cache(maxsize=16)
+def _ollama_embeddings(model: str, base_url: str) -> OllamaEmbeddings:
+    """
+    Shared OllamaEmbeddings per (model, server) so its HTTP client and connection
+    pool are reused by every RAG system and setup run instead of rebuilt per call.
+
+    Only the sync embed methods are used in this repo (retrieval runs sync chains in
+    a worker thread), so the instance is never tied to a particular event loop.
+    """
+    return OllamaEmbeddings(model=model, base_url=base_url)
@@ -1,12 +1,14 @@
 """
 Shared PostgreSQL/pgvector utilities for vector storage and retrieval.
 """
+import functools
 import os
 from typing import Optional, Tuple
 
 from langchain_core.embeddings import Embeddings
 from langchain_postgres import PGVector
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 
 from helpers.llm_utils import get_default_embedding_model, get_domain_embedding_model, get_embeddings
 
@@ -23,6 +25,22 @@ def get_postgres_connection_string() -> str:
     return f"postgresql+psycopg://{user}:{password}@{host}:{port}/{database}"
 
 
+@functools.lru_cache(maxsize=None)
+def _engine_for_url(connection_string: str) -> Engine:
+    # pool_pre_ping recycles connections dropped while the app sat idle
+    return create_engine(connection_string, pool_pre_ping=True)
+
+
+def get_postgres_engine() -> Engine:
+    """
+    Return the shared SQLAlchemy engine for the current Postgres settings.
+
+    Engines own a connection pool, so one is kept per connection string and
+    reused instead of creating a new engine (and new connections) per query.
+    """
+    return _engine_for_url(get_postgres_connection_string())
+
+
 def get_collection_name(domain_name: str, environment: Optional[str] = None) -> str:
     """
     SQL-safe collection name for a domain/environment pair.
@@ -34,10 +52,35 @@ def get_collection_name(domain_name: str, environment: Optional[str] = None) ->
     return f"{domain_name}_{env}_index"
 
 
+def get_staging_collection_name(domain_name: str, environment: Optional[str] = None) -> str:
+    """Collection that setup ingests into before it replaces the live one."""
+    return f"{get_collection_name(domain_name, environment)}_staging"
+
+
+def promote_staging_collection(domain_name: str, environment: Optional[str] = None) -> None:
+    """
+    Replace the domain's live collection with its fully ingested staging collection.
+
+    Both statements run in one transaction, so retrieval sees either the old
+    collection or the new one, never an empty index. Deleting the old collection
+    row cascades to its embeddings.
+    """
+    collection_name = get_collection_name(domain_name, environment)
+    with get_postgres_engine().begin() as conn:
+        conn.execute(
+            text("DELETE FROM langchain_pg_collection WHERE name = :name"),
+            {"name": collection_name},
+        )
+        conn.execute(
+            text("UPDATE langchain_pg_collection SET name = :name WHERE name = :staging"),
+            {"name": collection_name, "staging": get_staging_collection_name(domain_name, environment)},
+        )
+
+
 def collection_exists(domain_name: str, environment: Optional[str] = None) -> bool:
     """Return True if the pgvector collection has been created for this domain."""
     collection_name = get_collection_name(domain_name, environment)
-    engine = create_engine(get_postgres_connection_string())
+    engine = get_postgres_engine()
     with engine.connect() as conn:
         row = conn.execute(
             text(
@@ -54,13 +97,23 @@ def create_pgvector_store(
     environment: Optional[str] = None,
     *,
     pre_delete_collection: bool = False,
+    staging: bool = False,
 ) -> Tuple[PGVector, str]:
-    """Create or connect to a PGVector store for the given domain."""
-    collection_name = get_collection_name(domain_name, environment)
+    """
+    Create or connect to a PGVector store for the given domain.
+
+    The store shares the process-wide engine, so every domain's collection
+    draws from one connection pool instead of opening its own. With staging=True
+    the store targets the domain's staging collection (see promote_staging_collection).
+    """
+    if staging:
+        collection_name = get_staging_collection_name(domain_name, environment)
+    else:
+        collection_name = get_collection_name(domain_name, environment)
     vector_store = PGVector(
         embeddings=embeddings,
         collection_name=collection_name,
-        connection=get_postgres_connection_string(),
+        connection=get_postgres_engine(),
         use_jsonb=True,
         pre_delete_collection=pre_delete_collection,
     )
@@ -11,10 +11,14 @@ Example:
     python setup_vectordb.py finance
 """
 import argparse
+import csv
 import sys
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Tuple
 
 # Add parent directory to path to import from project root
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,24 +26,208 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from setup_env import setup_environment
 from domain_manager import DomainManager
 from langchain_community.document_loaders.csv_loader import CSVLoader
-from langchain_community.document_loaders import DirectoryLoader
+from langchain_community.document_loaders import UnstructuredFileLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
 from helpers.llm_utils import get_domain_embedding_model, get_embeddings
 from langchain_core.documents import Document
-from helpers.pgvector_utils import create_pgvector_store, get_collection_name
+from helpers.pgvector_utils import (
+    create_pgvector_store,
+    get_collection_name,
+    get_staging_collection_name,
+    promote_staging_collection,
+)
 from helpers.sql_utils import load_domain_relational_csvs
 import getpass
-import uuid
-import pandas as pd
+import secrets
+
+# Thread count for reading document files
+LOADER_CONCURRENCY = 8
+
+# On-disk cache of chunk embeddings, reused across setup runs
+EMBEDDING_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "embeddings"
+
+# Texts per embedding request and concurrent embedding requests
+EMBED_BATCH_SIZE = 256
+EMBED_WORKERS = 4
+
+# Domains whose vector index is built from docs/qa.csv:
+# domain -> (FAQ title, question label, answer label)
+FAQ_DOMAINS = {
+    "bank": ("Online Bank FAQ", "Question", "Answer"),
+    "healthcare": ("Healthcare FAQ", "Medication", "Information"),
+    "restaurant": ("Restaurant FAQ", "Question", "Answer"),
+    "insurance": ("Insurance FAQ", "Question", "Answer"),
+}
+
+
+def _build_faq_documents(
+    docs_dir: str,
+    domain_name: str,
+    title: str,
+    question_label: str,
+    answer_label: str,
+) -> List[Document]:
+    """Build one FAQ Document per row of the domain's qa.csv."""
+    csv_path = os.path.join(docs_dir, "qa.csv")
+    doc_list: List[Document] = []
+    # Plain csv rows are already dicts of strings; no DataFrame or per-row Series needed
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        question = (row.get("question") or "").strip()
+        answer = row.get("answer") or ""
+        body = (
+            f"[FAQ] {title}. "
+            f"{question_label}: {question}. "
+            f"{answer_label}: {answer}. "
+        )
+        meta = {
+            "doc_family": domain_name,
+            "question": question,
+            "answer": answer
+        }
+        doc_list.append(Document(page_content=body, metadata=meta))
+    return doc_list
+
+
+def _cache_backed_embeddings(embeddings, embedding_model: str):
+    """
+    Wrap embeddings with an on-disk cache keyed by chunk text and model.
+
+    Re-running setup after small doc edits only embeds the chunks that changed.
+    """
+    return CacheBackedEmbeddings.from_bytes_store(
+        embeddings,
+        LocalFileStore(str(EMBEDDING_CACHE_DIR)),
+        namespace=embedding_model,
+        key_encoder="sha256",
+    )
+
+
+def _partition_doc_files(docs_dir: str) -> Tuple[List[str], List[str]]:
+    """
+    Walk the docs tree once and split file paths into (non-CSV, CSV).
+
+    Hidden files and directories are skipped, matching DirectoryLoader's default.
+    """
+    non_csv_paths, csv_paths = [], []
+    pending_dirs = [docs_dir]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    pending_dirs.append(entry.path)
+                elif entry.is_file():
+                    (csv_paths if entry.name.endswith(".csv") else non_csv_paths).append(entry.path)
+    return sorted(non_csv_paths), sorted(csv_paths)
+
+
+def _load_file(loader_cls, path: str) -> List[Document]:
+    """Load a single file with the given LangChain loader class."""
+    return loader_cls(path).load()
+
+
+def _iter_loaded_files(
+    tasks: List[Tuple[type, str]],
+    max_workers: int = LOADER_CONCURRENCY,
+) -> Iterator[Tuple[type, List[Document]]]:
+    """
+    Load files on a thread pool, yielding (loader class, documents) per file in order.
+
+    Only a small window of files is read ahead of the consumer, so memory stays
+    bounded by that window rather than growing with the whole corpus.
+    """
+    task_iter = iter(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            (loader_cls, executor.submit(_load_file, loader_cls, path))
+            for loader_cls, path in islice(task_iter, max_workers * 2)
+        )
+        while pending:
+            loader_cls, future = pending.popleft()
+            for next_cls, next_path in islice(task_iter, 1):
+                pending.append((next_cls, executor.submit(_load_file, next_cls, next_path)))
+            yield loader_cls, future.result()
+
+
+def _iter_document_chunks(
+    text_splitter: RecursiveCharacterTextSplitter,
+    non_csv_paths: List[str],
+    csv_paths: List[str],
+) -> Iterator[Document]:
+    """Load, split and yield chunks file by file; CSV rows are yielded unsplit."""
+    tasks = [(UnstructuredFileLoader, path) for path in non_csv_paths]
+    for _, docs in _iter_loaded_files(tasks):
+        yield from text_splitter.split_documents(docs)
+
+    # CSV rows are one Document each; stream them rather than loading whole files
+    for path in csv_paths:
+        yield from CSVLoader(path).lazy_load()
+
+
+def add_documents_batched(
+    vector_store,
+    embeddings,
+    documents: Iterable[Document],
+    batch_size: int = EMBED_BATCH_SIZE,
+    max_workers: int = EMBED_WORKERS,
+) -> int:
+    """
+    Embed documents in batches on a thread pool, then insert them with random IDs.
 
+    Embedding requests are network bound, so several batches are sent to the
+    embedding server at once; the vectors are then written with add_embeddings
+    so the store does not embed the texts a second time. Documents are pulled
+    from the iterable one group of batches at a time, so a lazily produced
+    corpus is never held in memory all at once.
 
-def setup_vectordb_for_domain(domain_name: str, environment: str = "local"):
+    Returns:
+        Number of documents added
+    """
+    doc_iter = iter(documents)
+    total = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            group = list(islice(doc_iter, batch_size * max_workers))
+            if not group:
+                break
+
+            texts = [doc.page_content for doc in group]
+            metadatas = [doc.metadata for doc in group]
+            ids = [secrets.token_hex(16) for _ in group]
+
+            batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+            vectors = [
+                vector
+                for batch_vectors in executor.map(embeddings.embed_documents, batches)
+                for vector in batch_vectors
+            ]
+
+            vector_store.add_embeddings(texts=texts, embeddings=vectors, metadatas=metadatas, ids=ids)
+            total += len(group)
+    return total
+
+
+def setup_vectordb_for_domain(
+    domain_name: str,
+    environment: str = "local",
+    batch_size: int = EMBED_BATCH_SIZE,
+    max_workers: int = EMBED_WORKERS,
+    use_embedding_cache: bool = True,
+):
     """
     Set up vector database for a specific domain using its configuration.
 
     Args:
         domain_name: Name of the domain (e.g., 'finance')
         environment: Vector index environment (always 'local')
+        batch_size: Texts per embedding request
+        max_workers: Concurrent embedding requests
+        use_embedding_cache: Reuse vectors from earlier runs for unchanged chunks
     """
     requested_env = environment
     environment = "local"
@@ -87,22 +275,16 @@ def setup_vectordb_for_domain(domain_name: str, environment: str = "local"):
 
     if domain_name == "mgm_marketing":
         # Custom path below uses explicit CSV + markdown read (avoids Unstructured on .md)
-        non_csv_docs = []
-        csv_docs = []
         all_docs = []
-        print("✓ mgm_marketing: skipping generic DirectoryLoader (custom ingestion)")
+        print("✓ mgm_marketing: skipping generic document loading (custom ingestion)")
     else:
-        # Load non-CSV documents
-        non_csv_loader = DirectoryLoader(docs_dir, exclude=["**/*.csv"])
-        non_csv_docs = non_csv_loader.load()
-        print(f"✓ Loaded {len(non_csv_docs)} non-CSV documents")
-
-        # Load CSV documents
-        csv_loader = DirectoryLoader(docs_dir, glob="**/*.csv", loader_cls=CSVLoader)
-        csv_docs = csv_loader.load()
-        print(f"✓ Loaded {len(csv_docs)} CSV documents")
+        # One walk of the docs tree; files are then loaded on a thread pool (file
+        # reads are I/O bound) as the embedding loop consumes them
+        non_csv_paths, csv_paths = _partition_doc_files(docs_dir)
+        print(f"✓ Found {len(non_csv_paths)} non-CSV files")
+        print(f"✓ Found {len(csv_paths)} CSV files")
 
-        if len(non_csv_docs) == 0 and len(csv_docs) == 0:
+        if not non_csv_paths and not csv_paths:
             print(f"⚠️  No documents found in {docs_dir}")
             return False
 
@@ -112,156 +294,60 @@ def setup_vectordb_for_domain(domain_name: str, environment: str = "local"):
             chunk_overlap=chunk_overlap,
             add_start_index=True
         )
-        split_docs = text_splitter.split_documents(non_csv_docs)
-
-        # Combine all documents
-        all_docs = split_docs + csv_docs
-        print(f"✓ Total document chunks: {len(all_docs)}")
+        # Files are loaded and split lazily and consumed batch by batch when embedding
+        all_docs = _iter_document_chunks(text_splitter, non_csv_paths, csv_paths)
 
         # Preview first few documents
+        preview_docs = list(islice(all_docs, 3))
         print("\nDocument preview:")
-        for i, doc in enumerate(all_docs[:3]):
+        for i, doc in enumerate(preview_docs):
             print(f"Doc {i+1}: {doc.page_content[:100]}...")
             print(f"Metadata: {doc.metadata}")
             print("-" * 50)
+        all_docs = chain(preview_docs, all_docs)
 
     if not os.environ.get("POSTGRES_PASSWORD"):
         os.environ["POSTGRES_PASSWORD"] = getpass.getpass("Enter PostgreSQL password: ")
 
     embeddings = get_embeddings(embedding_model, provider="local")
+    # Ingestion goes through the on-disk cache; the store keeps the raw embeddings for queries
+    ingest_embeddings = (
+        _cache_backed_embeddings(embeddings, embedding_model) if use_embedding_cache else embeddings
+    )
 
+    # Documents are still loaded lazily while embedding, so ingest into a staging
+    # collection and only replace the live one once everything has been written;
+    # a file that fails to parse leaves the existing index untouched
     collection_name = get_collection_name(domain_name, environment)
-    print(f"Creating PostgreSQL/pgvector collection: {collection_name}")
-    vector_store, collection_name = create_pgvector_store(
+    staging_name = get_staging_collection_name(domain_name, environment)
+    print(f"Creating PostgreSQL/pgvector staging collection: {staging_name}")
+    vector_store, _ = create_pgvector_store(
         embeddings,
         domain_name,
         environment,
         pre_delete_collection=True,
+        staging=True,
     )
 
-    # Add documents to vector store with UUIDs
+    # Add documents to vector store with random IDs
     print("Adding documents to vector store...")
-    embedded_count = 0
-
-    if domain_name == "bank":
-        # Wifi QA Docs
-        csv_path = os.path.join(docs_dir, "qa.csv")
-        df = pd.read_csv(csv_path)
-        doc_list: List[Document] = []
-        uuid_list = []
-        for _, row in df.iterrows():
-            question = str(row.get("question", "") or "").strip()
-            answer = str(row.get("answer", "") or "")
-            body = (
-                f"[FAQ] Online Bank FAQ. "
-                f"Question: {question}. "
-                f"Answer: {answer}. "
-            )
-            meta = {
-                "doc_family": "bank",
-                "question": question,
-                "answer": answer
-            }
-            doc_list.append(Document(page_content=body, metadata=meta))
-            uuid_list.append(uuid.uuid4())
-        
-        vector_store.add_documents(documents=doc_list, ids=uuid_list)
-        embedded_count = len(doc_list)
-
-        print("Loading relational tables for bank...")
-        load_domain_relational_csvs(docs_dir, domain_name)
-
-    elif domain_name == "healthcare":
-        # QA Docs
-        csv_path = os.path.join(docs_dir, "qa.csv")
-        df = pd.read_csv(csv_path)
-        doc_list: List[Document] = []
-        uuid_list = []
-        for _, row in df.iterrows():
-            question = str(row.get("question", "") or "").strip()
-            answer = str(row.get("answer", "") or "")
-            body = (
-                f"[FAQ] Healthcare FAQ. "
-                f"Medication: {question}. "
-                f"Information: {answer}. "
-            )
-            meta = {
-                "doc_family": "healthcare",
-                "question": question,
-                "answer": answer
-            }
-            doc_list.append(Document(page_content=body, metadata=meta))
-            uuid_list.append(uuid.uuid4())
-        
-        vector_store.add_documents(documents=doc_list, ids=uuid_list)
-        embedded_count = len(doc_list)
-
-        print("Loading relational tables for healthcare...")
-        load_domain_relational_csvs(docs_dir, domain_name)
 
-    elif domain_name == "restaurant":
-        # QA Docs
-        csv_path = os.path.join(docs_dir, "qa.csv")
-        df = pd.read_csv(csv_path)
-        doc_list: List[Document] = []
-        uuid_list = []
-        for _, row in df.iterrows():
-            question = str(row.get("question", "") or "").strip()
-            answer = str(row.get("answer", "") or "")
-            body = (
-                f"[FAQ] Restaurant FAQ. "
-                f"Question: {question}. "
-                f"Answer: {answer}. "
-            )
-            meta = {
-                "doc_family": "restaurant",
-                "question": question,
-                "answer": answer
-            }
-            doc_list.append(Document(page_content=body, metadata=meta))
-            uuid_list.append(uuid.uuid4())
-        
-        vector_store.add_documents(documents=doc_list, ids=uuid_list)
-        embedded_count = len(doc_list)
-
-        print("Loading relational tables for healthcare...")
-        load_domain_relational_csvs(docs_dir, domain_name)
+    faq_labels = FAQ_DOMAINS.get(domain_name)
+    if faq_labels:
+        doc_list = _build_faq_documents(docs_dir, domain_name, *faq_labels)
+        embedded_count = add_documents_batched(
+            vector_store, ingest_embeddings, doc_list, batch_size=batch_size, max_workers=max_workers
+        )
 
-    elif domain_name == "insurance":
-        # QA Docs
-        csv_path = os.path.join(docs_dir, "qa.csv")
-        df = pd.read_csv(csv_path)
-        doc_list: List[Document] = []
-        uuid_list = []
-        for _, row in df.iterrows():
-            question = str(row.get("question", "") or "").strip()
-            answer = str(row.get("answer", "") or "")
-            body = (
-                f"[FAQ] Insurance FAQ. "
-                f"Question: {question}. "
-                f"Answer: {answer}. "
-            )
-            meta = {
-                "doc_family": "insurance",
-                "question": question,
-                "answer": answer
-            }
-            doc_list.append(Document(page_content=body, metadata=meta))
-            uuid_list.append(uuid.uuid4())
-        
-        vector_store.add_documents(documents=doc_list, ids=uuid_list)
-        embedded_count = len(doc_list)
-
-        print("Loading relational tables for insurance...")
+        print(f"Loading relational tables for {domain_name}...")
         load_domain_relational_csvs(docs_dir, domain_name)
-
-
     else:
-        uuid_list = [uuid.uuid4() for _ in all_docs]
-        vector_store.add_documents(documents=all_docs, ids=uuid_list)
-        embedded_count = len(all_docs)
-
+        embedded_count = add_documents_batched(
+            vector_store, ingest_embeddings, all_docs, batch_size=batch_size, max_workers=max_workers
+        )
 
+    promote_staging_collection(domain_name, environment)
+    print(f"✓ Replaced {collection_name} with {staging_name}")
 
     print(f"✅ Successfully created vector database for {domain_name}")
     print(f"📊 Total documents embedded: {embedded_count}")
@@ -285,6 +371,23 @@ def main():
         default="local",
         help="Vector index environment (always 'local')",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=EMBED_BATCH_SIZE,
+        help=f"Texts per embedding request (default: {EMBED_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=EMBED_WORKERS,
+        help=f"Concurrent embedding requests (default: {EMBED_WORKERS})",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_true",
+        help="Re-embed every chunk instead of reusing cached vectors",
+    )
     parser.add_argument(
         "--list-domains",
         action="store_true",
@@ -301,7 +404,16 @@ def main():
             print(f"  - {domain}")
         return
 
-    success = setup_vectordb_for_domain(args.domain, args.environment)
+    if args.batch_size < 1 or args.workers < 1:
+        parser.error("--batch-size and --workers must be at least 1")
+
+    success = setup_vectordb_for_domain(
+        args.domain,
+        args.environment,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        use_embedding_cache=not args.no_embedding_cache,
+    )
     if not success:
         sys.exit(1)
 
@@ -6,10 +6,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 
-from helpers.pgvector_utils import get_postgres_connection_string
+from helpers.pgvector_utils import get_postgres_engine
 
 
 def relational_table_name(domain_name: str, table_suffix: str) -> str:
@@ -117,7 +117,7 @@ def load_relational_csv(
 def load_domain_relational_csvs(docs_dir: str | Path, domain_name: str) -> List[Tuple[str, int]]:
     """Load every relational_*.csv file in a domain docs directory."""
     docs_path = Path(docs_dir)
-    engine = create_engine(get_postgres_connection_string())
+    engine = get_postgres_engine()
     results: List[Tuple[str, int]] = []
 
     for csv_path in sorted(docs_path.glob("relational_*.csv")):
@@ -166,7 +166,7 @@ def execute_sql(sql: str) -> Dict[str, Any]:
     """
     sql_clean = (sql or "").strip().rstrip(";")
     operation = _sql_operation(sql_clean)
-    engine = create_engine(get_postgres_connection_string())
+    engine = get_postgres_engine()
 
     with engine.begin() as conn:
         result = conn.execute(text(sql_clean))
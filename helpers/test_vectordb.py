@@ -1,30 +1,41 @@
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from setup_env import setup_environment
-setup_environment()
+"""
+Quick similarity-search check against a domain's pgvector collection.
 
-# from dotenv import load_dotenv
-# load_dotenv()
+Usage:
+    python helpers/test_vectordb.py <domain_name> "<query>" [--k 2]
 
-import getpass
+All work happens in main(), so importing this module (e.g. during pytest
+collection, which picks up test_*.py files) stays side-effect free.
+"""
+import argparse
 import os
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a similarity search against a domain vector store")
+    parser.add_argument("domain", help="Domain name (e.g. bank, healthcare)")
+    parser.add_argument("query", help="Query text to search for")
+    parser.add_argument("--k", type=int, default=2, help="Number of results to return")
+    args = parser.parse_args()
+
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from domain_manager import DomainManager
+    from setup_env import setup_environment
+    from helpers.llm_utils import get_domain_embedding_model
+    from helpers.pgvector_utils import get_pgvector_store
+
+    domain_config = DomainManager().load_domain_config(args.domain)
+    setup_environment(args.domain, domain_config.config)
 
-from helpers.llm_utils import get_embeddings
+    embedding_model = get_domain_embedding_model(domain_config.config.get("vectorstore", {}))
+    vector_store, collection_name = get_pgvector_store(args.domain, embedding_model)
+    print(f"🔍 Searching '{collection_name}' for: {args.query}")
 
-embeddings = get_embeddings("nomic-embed-text")
-from langchain_chroma import Chroma
+    results = vector_store.similarity_search(args.query, k=args.k)
+    for res in results:
+        print(f"* {res.page_content} [{res.metadata}]")
 
-vector_store = Chroma(
-    collection_name="finance_collection",
-    embedding_function=embeddings,
-    persist_directory="/Users/michaelbranconier/galileo/galileo-demo-official/domains/finance/chroma_db",
-)
 
-results = vector_store.similarity_search(
-    "Tell me about ebay", # paste 
-    k=2,
-)
-print(results)
-for res in results:
-    print(f"* {res.page_content} [{res.metadata}]")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
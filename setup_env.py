@@ -1,11 +1,34 @@
 """
 Environment Setup - Load secrets and set environment variables
 """
+import functools
 import os
-import toml
+import threading
 import yaml
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import tomllib  # Python 3.11+: C-accelerated parser in the stdlib
+except ImportError:  # older interpreters fall back to the toml package
+    tomllib = None
+    import toml
+
+
+# Key and environment of the last successful setup_environment() call. A repeat
+# call with the same domain settings and unchanged secrets file is skipped as
+# long as every variable it set still holds the value it was given.
+_LAST_SETUP: Optional[Tuple[tuple, Dict[str, str]]] = None
+_LAST_SETUP_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_secrets(path: str, mtime_ns: int) -> dict:
+    """Parse secrets.toml once per file version (mtime_ns keys the cache; callers must not mutate)."""
+    if tomllib is not None:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    return toml.load(path)
 
 
 def _derive_galileo_api_url(console_url: str, explicit_url: str = "") -> str:
@@ -69,6 +92,8 @@ def setup_environment(domain_name: Optional[str] = None, domain_config: Optional
         domain_name: Name of the domain to set up (e.g., "finance"). Optional for CLI scripts.
         domain_config: Loaded domain config dict (optional, for domain-specific settings)
     """
+    global _LAST_SETUP
+
     secrets_path = Path(".streamlit/secrets.toml")
     
     if not secrets_path.exists():
@@ -78,9 +103,23 @@ def setup_environment(domain_name: Optional[str] = None, domain_config: Optional
         if not secrets_path.exists():
             return
     
+    galileo_cfg = (domain_config or {}).get("galileo", {}) if domain_name else {}
+    setup_key = (
+        str(secrets_path.resolve()),
+        secrets_path.stat().st_mtime_ns,
+        domain_name,
+        get_domain_project_name(domain_name, domain_config) if domain_name else None,
+        galileo_cfg.get("log_stream", "default") if domain_name else None,
+    )
+    with _LAST_SETUP_LOCK:
+        last_setup = _LAST_SETUP
+    if last_setup is not None and last_setup[0] == setup_key:
+        if all(os.environ.get(key) == value for key, value in last_setup[1].items()):
+            return
+
     try:
         # Load secrets
-        secrets = toml.load(secrets_path)
+        secrets = _load_secrets(setup_key[0], setup_key[1])
 
         console_url = secrets.get("galileo_console_url", "https://app.galileo.ai")
         galileo_api_url = _derive_galileo_api_url(
@@ -135,12 +174,14 @@ def setup_environment(domain_name: Optional[str] = None, domain_config: Optional
             env_vars["GALILEO_PROJECT"] = project_name
             env_vars["GALILEO_LOG_STREAM"] = log_stream
         
-        for key, value in env_vars.items():
-            if value:  # Only set if value is not empty
-                os.environ[key] = value
-                # print(f"✅ Set {key}")
-            else:
-                print(f"⚠️  {key} not set (empty value)")
+        applied = {key: value for key, value in env_vars.items() if value}  # Only set non-empty values
+        os.environ.update(applied)
+        missing = [key for key, value in env_vars.items() if not value]
+        if missing:
+            print(f"⚠️  Not set (empty value): {', '.join(missing)}")
+
+        with _LAST_SETUP_LOCK:
+            _LAST_SETUP = (setup_key, applied)
         
         if domain_name:
             project_name = get_domain_project_name(domain_name, domain_config)